@@ -14,6 +14,10 @@ BRACKET SUMMARY:
 - Bracket 5 (cEDH): Competitive. Full optimization.
 """
 
+import sys
+from collections import Counter
+from dataclasses import dataclass
+
 # ============================================================================
 # GAME CHANGERS LIST (as of October 2025)
 # These are cards that "dramatically warp Commander games" - having any of these
@@ -247,6 +251,26 @@ EXTRA_TURN_CARDS = [
     "Wanderwine Prophets",
 ]
 
+# ============================================================================
+# PRECOMPUTED LOOKUP SETS
+# The lists above are the human-readable source of truth; the frozensets
+# below are what deck scans actually match against. Placeholder entries
+# (kept in the lists for documentation) can never match a real card name,
+# so they're excluded from the live lookup structures at import time.
+# ============================================================================
+_PLACEHOLDER_NAMES = {"Extra Turn"}
+
+# sys.intern lets repeated membership tests degrade to pointer compares
+# when the probe strings are interned too (see _prepare_cards)
+MASS_LAND_DENIAL_SET = frozenset(
+    sys.intern(name.lower()) for name in MASS_LAND_DENIAL
+    if name not in _PLACEHOLDER_NAMES
+)
+EXTRA_TURN_CARDS_SET = frozenset(
+    sys.intern(name.lower()) for name in EXTRA_TURN_CARDS
+    if name not in _PLACEHOLDER_NAMES
+)
+
 # ============================================================================
 # SCRYFALL API CONFIGURATION
 # ============================================================================
@@ -606,7 +630,8 @@ HIGH_POWER_STAPLES = [
 ]
 
 # Cards that allow multiple copies in Commander (singleton exception)
-UNLIMITED_COPIES_CARDS = {
+# frozenset: these are hot O(1) membership tables for deck validation
+UNLIMITED_COPIES_CARDS = frozenset({
     # These cards have "A deck can have any number of cards named ~"
     "relentless rats",
     "rat colony", 
@@ -615,7 +640,7 @@ UNLIMITED_COPIES_CARDS = {
     "dragon's approach",
     "slime against humanity",
     "hare apparent",
-}
+})
 
 # Cards with specific copy limits (not singleton, but not unlimited)
 LIMITED_COPIES_CARDS = {
@@ -624,51 +649,106 @@ LIMITED_COPIES_CARDS = {
 }
 
 # Basic land names (unlimited copies allowed)
-BASIC_LAND_NAMES = {
+BASIC_LAND_NAMES = frozenset({
     "plains", "island", "swamp", "mountain", "forest", "wastes",
     "snow-covered plains", "snow-covered island", "snow-covered swamp",
     "snow-covered mountain", "snow-covered forest",
-}
+})
 
 # ============================================================================
 # SCORING WEIGHTS FOR BRACKET CALCULATION
 # These control how much each factor contributes to bracket determination.
+# A frozen dataclass (instead of a dict) makes each threshold a plain
+# attribute access on the scoring hot path and catches typos at import time.
 # ============================================================================
-BRACKET_SCORING = {
+@dataclass(slots=True, frozen=True)
+class BracketScoring:
+    """Scoring weights and thresholds for bracket determination."""
+
     # Tutor weights (points per tutor)
-    "tutor_premium_weight": 3.0,
-    "tutor_efficient_weight": 2.0,
-    "tutor_standard_weight": 1.0,
-    "tutor_slow_weight": 0.5,
-    
+    tutor_premium_weight: float = 3.0
+    tutor_efficient_weight: float = 2.0
+    tutor_standard_weight: float = 1.0
+    tutor_slow_weight: float = 0.5
+
     # Tutor thresholds
-    "tutor_bracket3_threshold": 6,   # 6+ tutor points = Bracket 3
-    "tutor_bracket4_threshold": 12,  # 12+ tutor points = Bracket 4
-    
+    tutor_bracket3_threshold: float = 6    # 6+ tutor points = Bracket 3
+    tutor_bracket4_threshold: float = 12   # 12+ tutor points = Bracket 4
+
     # Fast mana thresholds
-    "fast_mana_bracket4_threshold": 4,  # 4+ fast mana = Bracket 4
-    "fast_mana_cedh_threshold": 6,      # 6+ fast mana = cEDH signal
-    
+    fast_mana_bracket4_threshold: int = 4  # 4+ fast mana = Bracket 4
+    fast_mana_cedh_threshold: int = 6      # 6+ fast mana = cEDH signal
+
     # Free interaction thresholds
-    "free_interaction_cedh_threshold": 3,  # 3+ free spells = cEDH signal
-    
-    # High power staple thresholds  
-    "staples_bracket3_threshold": 5,   # 5+ staples = Bracket 3 signal
-    "staples_bracket4_threshold": 10,  # 10+ staples = Bracket 4 signal
-    
+    free_interaction_cedh_threshold: int = 3  # 3+ free spells = cEDH signal
+
+    # High power staple thresholds
+    staples_bracket3_threshold: int = 5    # 5+ staples = Bracket 3 signal
+    staples_bracket4_threshold: int = 10   # 10+ staples = Bracket 4 signal
+
     # Combo thresholds (from Commander Spellbook)
-    "combo_bracket3_tags": ["S", "PW", "O"],  # Spicy, Powerful, Oddball
-    "combo_bracket4_tags": ["R"],              # Ruthless
-    
+    combo_bracket3_tags: tuple = ("S", "PW", "O")  # Spicy, Powerful, Oddball
+    combo_bracket4_tags: tuple = ("R",)            # Ruthless
+
     # cEDH signal threshold
-    "cedh_signal_threshold": 12,  # 12+ cEDH signals = Bracket 5
-    
+    cedh_signal_threshold: int = 12  # 12+ cEDH signals = Bracket 5
+
     # Average CMC thresholds
-    "avg_cmc_cedh": 2.0,       # Avg CMC < 2.0 is cEDH signal
-    "avg_cmc_optimized": 2.5,  # Avg CMC < 2.5 is optimization signal
-    
+    avg_cmc_cedh: float = 2.0       # Avg CMC < 2.0 is cEDH signal
+    avg_cmc_optimized: float = 2.5  # Avg CMC < 2.5 is optimization signal
+
     # Land count thresholds
-    "lands_cedh_max": 31,      # 31 or fewer lands = cEDH signal
-    
-    "jank_synergy_threshold": 40,  # Synergy score below this indicates jank deck
-}
\ No newline at end of file
+    lands_cedh_max: int = 31        # 31 or fewer lands = cEDH signal
+
+    jank_synergy_threshold: int = 40  # Synergy score below this indicates jank deck
+
+
+BRACKET_SCORING = BracketScoring()
+
+
+# ============================================================================
+# SINGLE-PASS CARD CLASSIFICATION
+# Maps each lowercased card name to the scoring categories it belongs to,
+# so a deck can be classified in one pass instead of one scan per category
+# list. A card may appear in several categories (e.g. Chrome Mox is both
+# fast mana and a Game Changer).
+# ============================================================================
+_CATEGORY_SOURCES = {
+    "tutor_premium": TUTORS_PREMIUM,
+    "tutor_efficient": TUTORS_EFFICIENT,
+    "tutor_standard": TUTORS_STANDARD,
+    "tutor_slow": TUTORS_SLOW,
+    "fast_mana": FAST_MANA,
+    "free_interaction": FREE_INTERACTION,
+    "high_power_staples": HIGH_POWER_STAPLES,
+    "competitive_stax": COMPETITIVE_STAX,
+    "game_changer": GAME_CHANGERS,
+    "mass_land_denial": MASS_LAND_DENIAL_SET,
+    "extra_turn": EXTRA_TURN_CARDS_SET,
+}
+
+CARD_CATEGORIES = {}
+for _category, _names in _CATEGORY_SOURCES.items():
+    for _name in _names:
+        _key = _name.lower()
+        CARD_CATEGORIES[_key] = CARD_CATEGORIES.get(_key, ()) + (_category,)
+
+
+def classify_deck(deck):
+    """
+    Classify a deck's card names into scoring categories in a single pass.
+
+    Instead of scanning the deck once per category list (tutors, fast mana,
+    staples, ...), this walks the deck once and tallies every category a
+    card belongs to.
+
+    Args:
+        deck: Iterable of card names (any case)
+
+    Returns:
+        Counter mapping category name (e.g. "tutor_premium", "fast_mana")
+        to the number of matching cards in the deck
+    """
+    return Counter(
+        tag for name in deck for tag in CARD_CATEGORIES.get(name.lower(), ())
+    )
\ No newline at end of file
@@ -14,19 +14,31 @@ It checks for:
 - Overall strategy/archetype
 """
 
+import bisect
+import functools
+import hashlib
+import json
+import logging
+import re
 import requests
+import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Set, Tuple, Optional
 from dataclasses import dataclass, field
 from config import (
-    GAME_CHANGERS, MASS_LAND_DENIAL, EXTRA_TURN_CARDS,
+    GAME_CHANGERS,
+    MASS_LAND_DENIAL_SET, EXTRA_TURN_CARDS_SET,
     ARCHETYPE_KEYWORDS, BRACKET_DEFINITIONS,
     # New imports for enhanced bracket calculation
     CEDH_COMMANDERS_TIER1, CEDH_COMMANDERS_TIER2,
-    FAST_MANA, FREE_INTERACTION, COMPETITIVE_STAX,
-    CEDH_COMBO_PIECES, HIGH_POWER_STAPLES,
     TUTORS_PREMIUM, TUTORS_EFFICIENT, TUTORS_STANDARD, TUTORS_SLOW,
-    BRACKET_SCORING,
+    BRACKET_SCORING, CARD_CATEGORIES,
     # Singleton exception cards
     UNLIMITED_COPIES_CARDS, LIMITED_COPIES_CARDS, BASIC_LAND_NAMES
 )
@@ -56,7 +68,7 @@ def count_cards_with_quantity(cards: List[Dict[str, Any]]) -> int:
         Total card count (sum of quantities)
     """
     return sum(card.get("_quantity", 1) for card in cards)
-from scryfall_client import ScryfallClient, parse_decklist
+from scryfall_client import ScryfallClient, parse_decklist, _loads_bytes
 
 # Optional import for combo detection
 try:
@@ -74,14 +86,251 @@ try:
 except ImportError:
     THEME_DETECTOR_AVAILABLE = False
 
+# Optional import for fast multi-pattern archetype matching
+# (pip install pyahocorasick) - we fall back to substring scanning without it
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Progress/diagnostic output goes through logging so batch or server
+# callers can silence it (the CLI configures INFO so nothing changes there)
+log = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Shared lowercase lookup sets
+# =============================================================================
+
+# Tutor tier lookup sets, lowercased once at import - _classify_tutors
+# used to rebuild all four on every call
+_TUTORS_PREMIUM_LC = frozenset(name.lower() for name in TUTORS_PREMIUM)
+_TUTORS_EFFICIENT_LC = frozenset(name.lower() for name in TUTORS_EFFICIENT)
+_TUTORS_STANDARD_LC = frozenset(name.lower() for name in TUTORS_STANDARD)
+_TUTORS_SLOW_LC = frozenset(name.lower() for name in TUTORS_SLOW)
+
+# Fallback Game Changers list, lowercased once at import instead of per call.
+# (MASS_LAND_DENIAL_SET / EXTRA_TURN_CARDS_SET come pre-lowercased from config.)
+# Names are interned so membership tests against interned probe strings
+# can settle on a pointer compare instead of a character compare.
+_GAME_CHANGERS_LC = frozenset(sys.intern(name.lower()) for name in GAME_CHANGERS)
+
+# cEDH commander lookup: the exact-name case resolves in one dict probe
+# (tier 1 wins if a name somehow appears in both lists). The bidirectional
+# substring scan survives only as a fallback for partial names, over
+# tuples lowercased once at import instead of per call.
+_CEDH_TIER1_LC = tuple(name.lower() for name in CEDH_COMMANDERS_TIER1)
+_CEDH_TIER2_LC = tuple(name.lower() for name in CEDH_COMMANDERS_TIER2)
+_CEDH_TIER_MAP: Dict[str, int] = {name: 2 for name in _CEDH_TIER2_LC}
+_CEDH_TIER_MAP.update((name, 1) for name in _CEDH_TIER1_LC)
+
+# Tutor tier weights as a tuple in tier order, hoisted from the scoring
+# config once so _calculate_tutor_score is a zip instead of four
+# attribute reads per call
+_TUTOR_TIER_ORDER = ("premium", "efficient", "standard", "slow")
+_TUTOR_WEIGHTS = (
+    BRACKET_SCORING.tutor_premium_weight,
+    BRACKET_SCORING.tutor_efficient_weight,
+    BRACKET_SCORING.tutor_standard_weight,
+    BRACKET_SCORING.tutor_slow_weight,
+)
+
+
+# On-disk cache for the Scryfall tutor database. The otag:tutor search
+# paginates through hundreds of cards, so persisting the result lets
+# later sessions skip the network entirely until the cache goes stale.
+_CACHE_DIR = Path.home() / ".cache" / "mtg_bracket"
+_TUTOR_CACHE_FILE = _CACHE_DIR / "tutors.json"
+_TUTOR_CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # Refresh weekly
+
+# Combo lookups are keyed by a content hash of the deck, so re-analyzing
+# the same 100 cards skips the Commander Spellbook round-trip entirely
+_COMBO_CACHE_FILE = _CACHE_DIR / "spellbook_combos.json"
+_COMBO_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60  # Spellbook adds combos daily-ish
+
+
+# Ramp staples that search for lands, not threats. Scryfall's
+# -otag:ramp exclusion normally keeps these out of the tutor database,
+# but tag coverage drifts and the config fallback has no tags at all,
+# so these common hits short-circuit before any tutor lookups.
+_RAMP_BLACKLIST = frozenset({
+    "rampant growth", "cultivate", "kodama's reach", "farseek",
+    "nature's lore", "three visits", "sakura-tribe elder",
+    "wood elves", "farhaven elf", "solemn simulacrum",
+    "ash barrens", "evolving wilds", "terramorphic expanse",
+    "myriad landscape", "blighted woodland",
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_official_game_changers(scryfall) -> frozenset:
+    """
+    Fetch the official Game Changers list from Scryfall (cached).
+
+    Module-level cache so multiple DeckAnalyzer instances sharing a
+    ScryfallClient only pay for the network fetch once.
+    """
+    return frozenset(
+        sys.intern(name.lower()) for name in scryfall.get_game_changers_list()
+    )
+
+
+# =============================================================================
+# Archetype keyword matching tables (built once at import / first use)
+# =============================================================================
+
+# Single-word indicators ("lifelink", "sacrifice", ...) can be matched
+# against a tokenized card text with O(1) set intersection. Multi-word
+# phrases ("extra turn", "search your library", ...) still need a
+# substring scan, so they're kept in separate per-archetype tuples.
+_SINGLE_WORD_INDICATORS: Dict[str, frozenset] = {}
+_PHRASE_INDICATORS: Dict[str, Tuple[str, ...]] = {}
+for _archetype, _indicators in ARCHETYPE_KEYWORDS.items():
+    _lowered = [i.lower() for i in _indicators]
+    _SINGLE_WORD_INDICATORS[_archetype] = frozenset(
+        i for i in _lowered if i.isalpha()
+    )
+    _PHRASE_INDICATORS[_archetype] = tuple(
+        i for i in _lowered if not i.isalpha()
+    )
+del _archetype, _indicators, _lowered
+
+# Integer-indexed views of the same tables. The detection loop counts
+# hits in a flat list indexed by archetype id, so every increment is a
+# list index instead of hashing the archetype name string, and the
+# automaton payloads can be plain int ids.
+_ARCH_NAMES: Tuple[str, ...] = tuple(ARCHETYPE_KEYWORDS)
+_SINGLE_WORDS_BY_ID = tuple(_SINGLE_WORD_INDICATORS[name] for name in _ARCH_NAMES)
+_PHRASES_BY_ID = tuple(_PHRASE_INDICATORS[name] for name in _ARCH_NAMES)
+
+# Compiled phrase alternation per archetype ("extra turn|take another
+# turn|..."), used when pyahocorasick isn't installed: one C-level
+# regex scan replaces the Python-level phrase-by-phrase substring loop.
+# None for archetypes whose indicators are all single words.
+_PHRASE_RE_BY_ID = tuple(
+    re.compile("|".join(re.escape(p) for p in phrases)) if phrases else None
+    for phrases in _PHRASES_BY_ID
+)
+
+# Word tokenizer for the single-word indicator path
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Process-wide lowercase memo. Card names and especially type lines
+# repeat heavily across decks in a session ("Creature — Human Soldier"),
+# so the second sighting of a string costs one dict hit instead of a new
+# lowercase allocation. Capped so pathological input can't grow it forever.
+_LOWER_CACHE: Dict[str, str] = {}
+_LOWER_CACHE_MAX = 65536
+
+
+def _lc(s: str) -> str:
+    """Memoized, interned str.lower() for hot repeated strings."""
+    cached = _LOWER_CACHE.get(s)
+    if cached is None:
+        cached = sys.intern(s.lower())
+        if len(_LOWER_CACHE) < _LOWER_CACHE_MAX:
+            _LOWER_CACHE[s] = cached
+    return cached
+
+
+# Color identity as a 5-bit mask: ORing masks replaces per-card set
+# updates in the fused scan, and one unpack at the end restores WUBRG order
+_COLOR_BIT = {"W": 1, "U": 2, "B": 4, "R": 8, "G": 16}
+
+# Category dispatch order for multi-type cards ("Artifact Creature" is a
+# creature first). Checked against the tokenized primary types, so each
+# check is one set lookup instead of a substring scan of the type line.
+_TYPE_PRIORITY = (
+    ("creature", "creatures"),
+    ("instant", "instants"),
+    ("sorcery", "sorceries"),
+    ("artifact", "artifacts"),
+    ("enchantment", "enchantments"),
+    ("land", "lands"),
+    ("planeswalker", "planeswalkers"),
+)
+
+# Bracket threshold ladders for _calculate_bracket_enhanced. Each rung is
+# (minimum value, bracket floor, reason template), ascending by minimum,
+# so one bisect replaces a chain of if/elif threshold comparisons.
+_GC_LADDER = (
+    (1, 3, "📜 Has {n} Game Changer(s) (requires Bracket 3+)"),
+    (4, 4, "📜 Has {n} Game Changers (>3 requires Bracket 4+)"),
+)
+_EXTRA_TURN_LADDER = (
+    (1, 3, "⏰ Has {n} extra turn card(s)"),
+    (3, 4, "⏰ Has {n} extra turn cards (high density)"),
+)
+_TUTOR_LADDER = (
+    (BRACKET_SCORING.tutor_bracket3_threshold, 3, "🔍 Moderate tutor density (score: {n:.1f})"),
+    (BRACKET_SCORING.tutor_bracket4_threshold, 4, "🔍 High tutor density (score: {n:.1f})"),
+)
+_FAST_MANA_LADDER = (
+    (2, 3, "💎 Has {n} fast mana pieces"),
+    (BRACKET_SCORING.fast_mana_bracket4_threshold, 4, "💎 High fast mana count ({n} pieces)"),
+)
+_STAPLE_LADDER = (
+    (BRACKET_SCORING.staples_bracket3_threshold, 3, "⭐ Has {n} high-power staples"),
+    (BRACKET_SCORING.staples_bracket4_threshold, 4, "⭐ High staple density ({n} high-power cards)"),
+)
+
+
+def _ladder_rung(ladder, value):
+    """
+    Find the highest rung whose minimum is <= value (or None if below all).
+
+    Rungs are (min_value, bracket_floor, reason_template) sorted ascending,
+    so a bisect lands on the applicable rung directly.
+    """
+    i = bisect.bisect_right(ladder, value, key=lambda rung: rung[0]) - 1
+    return ladder[i] if i >= 0 else None
+
+_archetype_automaton = None
 
-@dataclass
+
+def _get_archetype_automaton():
+    """
+    Build (once) an Aho-Corasick automaton over the phrase indicators.
+
+    One pass over a card's text then finds every multi-word archetype
+    phrase at once, instead of one substring scan per phrase per
+    archetype. Single-word indicators don't need it - they're matched
+    via the tokenized text. Returns None when pyahocorasick isn't
+    installed.
+    """
+    global _archetype_automaton
+
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    if _archetype_automaton is None:
+        # A phrase could belong to several archetypes, so the payload
+        # is the full tuple of archetype ids that use it
+        phrase_owners = {}
+        for arch_id, phrases in enumerate(_PHRASES_BY_ID):
+            for phrase in phrases:
+                phrase_owners[phrase] = phrase_owners.get(phrase, ()) + (arch_id,)
+
+        automaton = ahocorasick.Automaton()
+        for phrase, owners in phrase_owners.items():
+            automaton.add_word(phrase, owners)
+        automaton.make_automaton()
+        _archetype_automaton = automaton
+
+    return _archetype_automaton
+
+
+@dataclass(slots=True)
 class DeckAnalysis:
     """
     Container for all the analysis results of a deck.
-    
+
     This dataclass holds everything we learn about a deck,
     making it easy to pass around and display.
+
+    slots=True drops the per-instance __dict__ (~35 fields would make it
+    a big one) and turns attribute reads into direct slot loads.
     """
     # Basic deck info
     commander: str
@@ -190,6 +439,33 @@ class DeckAnalyzer:
         # Cache for tutor list from Scryfall (fetched once per session)
         # This avoids hitting the API repeatedly for large analyses
         self._tutor_cache = None
+
+        # Frozenset of tutor names, built lazily from the cache above
+        # (see the tutors_set property)
+        self._tutors_set = None
+
+        # Cache of finished analyses keyed by decklist hash, so re-analyzing
+        # the same deck (menu round-trips, repeated runs) is instant
+        self._analysis_cache: Dict[str, DeckAnalysis] = {}
+
+        # Combo results keyed by deck content hash (see _fetch_combos)
+        self._combo_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Session for the paginated tutor fetch: keep-alive amortizes the
+        # TLS handshake across pages, and Retry backs off transient errors
+        self._session = requests.Session()
+        self._session.headers.update({
+            "User-Agent": "MTGBracketAnalyzer/1.0",
+            "Accept": "application/json"
+        })
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=10, pool_maxsize=10, max_retries=retry
+        ))
     
     def _count_cards(self, cards: List[Dict[str, Any]]) -> int:
         """
@@ -268,13 +544,19 @@ class DeckAnalyzer:
             List of cards that are MDFCs with land backs
         """
         mdfc_lands = []
-        
+
         for card in cards:
+            # Fast path: the fused scan already decided this for each card
+            if "_is_mdfc_land" in card:
+                if card["_is_mdfc_land"]:
+                    mdfc_lands.append(card)
+                continue
+
             # Check if it's a modal DFC
             layout = card.get("layout", "")
             if layout != "modal_dfc":
                 continue
-            
+
             # Check if the back face is a land
             card_faces = card.get("card_faces", [])
             if len(card_faces) >= 2:
@@ -285,7 +567,7 @@ class DeckAnalyzer:
                 # If back face is a land, this is an MDFC land
                 if "Land" in back_type and "Land" not in front_type:
                     mdfc_lands.append(card)
-        
+
         return mdfc_lands
     
     def fetch_non_ramp_tutors(self) -> Dict[str, Dict[str, Any]]:
@@ -302,73 +584,74 @@ class DeckAnalyzer:
         Returns:
             Dictionary mapping card names to their data:
             {
-                "Demonic Tutor": {
-                    "mana_cost": "{1}{B}",
-                    "cmc": 2,
-                    "type": "Sorcery",
-                    "oracle_text": "Search your library...",
-                    "scryfall_uri": "https://..."
-                },
+                "Demonic Tutor": {"cmc": 2},
                 ...
             }
-        
+
+            Only the CMC is kept: tutor classification needs name
+            membership plus CMC for the tier fallback, and storing the
+            full oracle text / type / URI for every tutor in the game
+            multiplied the retained memory (and disk cache) ~50x for
+            fields nothing reads.
+
         Note: Results are cached after first fetch to avoid repeated API calls.
         """
         # Return cached results if available
         if self._tutor_cache is not None:
             return self._tutor_cache
-        
-        print("  📚 Fetching tutor database from Scryfall...")
-        
+
+        # Try the on-disk cache before going to the network - the tutor
+        # list changes rarely, so a week-old copy is perfectly good
+        cached = self._load_tutor_cache_from_disk()
+        if cached is not None:
+            log.info(f"  📚 Loaded {len(cached)} tutors from disk cache")
+            self._tutor_cache = cached
+            return cached
+
+        log.info("  📚 Fetching tutor database from Scryfall...")
+
         # Query for tutors that aren't ramp or fetchlands
         # otag = oracle tag, curated by Scryfall
         query = 'otag:tutor -otag:ramp -otag:fetchland'
-        
+
         url = "https://api.scryfall.com/cards/search"
         params = {
             'q': query,
             'unique': 'cards',
             'order': 'name'
         }
-        
+
         tutor_dictionary = {}
         api_success = False
-        
+        backoff = 1.0  # Exponential backoff for rate-limit responses
+
         while url:
             try:
-                response = requests.get(url, params=params, timeout=10)
-                
-                # Handle rate limiting
+                response = self._session.get(url, params=params, timeout=10)
+
+                # Handle rate limiting with exponential backoff
                 if response.status_code == 429:
-                    print("  ⏳ Rate limited, waiting...")
-                    time.sleep(5)
+                    log.info(f"  ⏳ Rate limited, waiting {backoff:.0f}s...")
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, 30)
                     continue
                 
                 if response.status_code != 200:
-                    print(f"  ⚠️  Scryfall error: {response.status_code}")
+                    log.warning(f"  ⚠️  Scryfall error: {response.status_code}")
                     break
                 
                 api_success = True
-                data = response.json()
+                # orjson-backed parse (falls back to stdlib json) - the
+                # tutor search returns ~175 full card objects per page
+                data = _loads_bytes(response.content)
                 
-                # Process the batch of cards
+                # Process the batch of cards. Keep only the CMC: name
+                # membership + CMC is all tutor classification uses, and
+                # the full page objects are garbage-collected per page
+                # instead of retained for the whole session
                 for card in data.get('data', []):
-                    name = card.get('name')
-                    
-                    # Handle Mana Cost (check faces for MDFCs)
-                    if 'mana_cost' in card:
-                        mana_cost = card['mana_cost']
-                    elif 'card_faces' in card:
-                        mana_cost = card['card_faces'][0].get('mana_cost', "")
-                    else:
-                        mana_cost = ""
-                    
-                    tutor_dictionary[name] = {
-                        "mana_cost": mana_cost,
-                        "cmc": card.get("cmc", 0),
-                        "type": card.get("type_line", ""),
-                        "oracle_text": card.get("oracle_text", "See Card Faces"),
-                        "scryfall_uri": card.get("scryfall_uri", "")
+                    tutor_dictionary[card.get('name')] = {
+                        "cmc": card.get("cmc", 0)
                     }
                 
                 # Pagination: Scryfall returns up to 175 cards per page
@@ -382,23 +665,57 @@ class DeckAnalyzer:
                     url = None
                     
             except requests.exceptions.RequestException as e:
-                print(f"  ⚠️  Network error fetching tutors: {e}")
+                log.warning(f"  ⚠️  Network error fetching tutors: {e}")
                 break
             except Exception as e:
-                print(f"  ⚠️  Error fetching tutors: {e}")
+                log.warning(f"  ⚠️  Error fetching tutors: {e}")
                 break
         
         # If API failed or returned no results, fall back to hardcoded lists
         if not api_success or len(tutor_dictionary) == 0:
-            print("  ⚠️  Using fallback tutor list from config...")
+            log.warning("  ⚠️  Using fallback tutor list from config...")
             tutor_dictionary = self._build_fallback_tutor_dict()
         else:
-            print(f"  ✅ Loaded {len(tutor_dictionary)} tutors from Scryfall")
-        
+            log.info(f"  ✅ Loaded {len(tutor_dictionary)} tutors from Scryfall")
+            # Persist for future sessions (the fallback dict is never
+            # written - it would mask a recovered network on next run)
+            self._save_tutor_cache_to_disk(tutor_dictionary)
+
         # Cache the results
         self._tutor_cache = tutor_dictionary
         return tutor_dictionary
-    
+
+    def _load_tutor_cache_from_disk(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Read the tutor database from the on-disk cache, if fresh enough.
+
+        Returns None when the cache is missing, stale (older than a week),
+        or unreadable - callers then fetch from Scryfall as usual.
+        """
+        try:
+            age = time.time() - _TUTOR_CACHE_FILE.stat().st_mtime
+            if age > _TUTOR_CACHE_MAX_AGE_SECONDS:
+                return None
+            with open(_TUTOR_CACHE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if data else None
+        except (OSError, ValueError):
+            return None
+
+    def _save_tutor_cache_to_disk(self, tutor_dict: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write the tutor database to the on-disk cache (best effort).
+
+        A failure here just means the next session re-fetches - not worth
+        surfacing to the user.
+        """
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(_TUTOR_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(tutor_dict, f)
+        except OSError:
+            pass
+
     def _build_fallback_tutor_dict(self) -> Dict[str, Dict[str, Any]]:
         """
         Build a tutor dictionary from our hardcoded config lists.
@@ -417,18 +734,18 @@ class DeckAnalyzer:
         }
         
         for name in TUTORS_PREMIUM:
-            tutor_dict[name] = {"cmc": tier_cmcs["premium"], "type": "Unknown", "mana_cost": "", "oracle_text": ""}
-        
+            tutor_dict[name] = {"cmc": tier_cmcs["premium"]}
+
         for name in TUTORS_EFFICIENT:
-            tutor_dict[name] = {"cmc": tier_cmcs["efficient"], "type": "Unknown", "mana_cost": "", "oracle_text": ""}
-        
+            tutor_dict[name] = {"cmc": tier_cmcs["efficient"]}
+
         for name in TUTORS_STANDARD:
-            tutor_dict[name] = {"cmc": tier_cmcs["standard"], "type": "Unknown", "mana_cost": "", "oracle_text": ""}
-        
+            tutor_dict[name] = {"cmc": tier_cmcs["standard"]}
+
         for name in TUTORS_SLOW:
-            tutor_dict[name] = {"cmc": tier_cmcs["slow"], "type": "Unknown", "mana_cost": "", "oracle_text": ""}
+            tutor_dict[name] = {"cmc": tier_cmcs["slow"]}
         
-        print(f"  ✅ Loaded {len(tutor_dict)} tutors from fallback list")
+        log.info(f"  ✅ Loaded {len(tutor_dict)} tutors from fallback list")
         return tutor_dict
     
     def _find_tutors(self, cards: List[Dict[str, Any]]) -> List[str]:
@@ -445,27 +762,44 @@ class DeckAnalyzer:
         Returns:
             List of tutor card names found in the deck
         """
-        tutors = []
-        
-        # Get the tutor list from Scryfall (cached after first call)
-        tutor_list = self.fetch_non_ramp_tutors()
-        
-        for card in cards:
-            name = card.get("name", "")
-            
-            # Check if this card is in our tutor database
-            if name in tutor_list:
-                tutors.append(name)
-            
-            # Also check for DFCs (double-faced cards) - check front face name
-            # Some tutors like "Bala Ged Recovery // Bala Ged Sanctuary" might
-            # be in the list under just the front face name
-            if " // " in name:
-                front_face = name.split(" // ")[0]
-                if front_face in tutor_list and name not in tutors:
-                    tutors.append(name)
-        
-        return tutors
+        # Memoized tutor name set (built from the cached Scryfall fetch)
+        tutors = self.tutors_set
+
+        # Tutor identification is pure name membership, so one set
+        # intersection replaces the per-card lookup loop (and the
+        # duplicate check the old append loop needed)
+        deck_names = {
+            card.get("name", "")
+            for card in cards
+            if card.get("_name_lc", card.get("name", "").lower()) not in _RAMP_BLACKLIST
+        }
+        hits = deck_names & tutors
+
+        # DFCs (double-faced cards) might be listed under just the front
+        # face name, e.g. "Bala Ged Recovery // Bala Ged Sanctuary"
+        hits |= {
+            name for name in deck_names
+            if " // " in name and name.split(" // ")[0] in tutors
+        }
+
+        return sorted(hits)
+
+    @property
+    def tutors_set(self) -> frozenset:
+        """
+        Tutor card names as a frozenset, memoized like game_changers_set.
+
+        The first access goes through fetch_non_ramp_tutors (instance
+        cache, then disk cache, then network); afterwards membership
+        tests are a single hash with no dict-view construction per call.
+        """
+        if self._tutors_set is None:
+            # Interned so the intersection with (also interned) deck
+            # names in _find_tutors compares pointers, not characters
+            self._tutors_set = frozenset(
+                map(sys.intern, self.fetch_non_ramp_tutors())
+            )
+        return self._tutors_set
     
     @property
     def game_changers_set(self) -> Set[str]:
@@ -477,44 +811,75 @@ class DeckAnalyzer:
         if self._game_changers_cache is None:
             # First, try to get from Scryfall (most up-to-date)
             try:
-                official_list = self.scryfall.get_game_changers_list()
-                self._game_changers_cache = {name.lower() for name in official_list}
+                self._game_changers_cache = _fetch_official_game_changers(self.scryfall)
             except Exception:
                 # Fall back to our config file list
-                print("  ⚠️  Couldn't fetch official Game Changers, using local list")
-                self._game_changers_cache = {name.lower() for name in GAME_CHANGERS}
-        
+                log.warning("  ⚠️  Couldn't fetch official Game Changers, using local list")
+                self._game_changers_cache = _GAME_CHANGERS_LC
+
         return self._game_changers_cache
     
-    def analyze_deck(self, decklist_text: str, commander_name: str = None) -> DeckAnalysis:
+    def analyze_deck(
+        self,
+        decklist_text: str,
+        commander_name: str = None,
+        fast_bracket_only: bool = False
+    ) -> DeckAnalysis:
         """
         Perform a complete analysis of a Commander deck.
-        
+
         Args:
             decklist_text: Raw decklist text (one card per line)
             commander_name: Optional explicit commander name. If None,
                           will try to detect from decklist.
-        
+            fast_bracket_only: If True, return early with a partial
+                          analysis as soon as cheap signals pin the deck
+                          at Bracket 4+ (>3 Game Changers or any mass
+                          land denial), skipping the combo lookup, cEDH
+                          scoring, archetype/theme/synergy detection.
+                          Useful for bulk triage; fast results are not
+                          cached so a later full run still computes
+                          everything.
+
         Returns:
             DeckAnalysis object with all computed metrics
         """
-        print("\n🔮 Starting deck analysis...")
-        
+        # Step 0: Check the analysis cache. The analysis is deterministic
+        # given the decklist and commander (plus the Scryfall snapshot this
+        # instance already holds), so a repeat run can skip every stage.
+        # Line order is preserved in the key because commander auto-detection
+        # depends on it.
+        cache_key = self._analysis_cache_key(decklist_text, commander_name)
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            log.info("\n🔮 Using cached analysis for this decklist")
+            return cached
+
+        log.info("\n🔮 Starting deck analysis...")
+
         # Step 1: Parse the decklist
-        print("  📝 Parsing decklist...")
+        log.info("  📝 Parsing decklist...")
         parsed_cards = parse_decklist(decklist_text)
         
         # Step 1.5: Validate card quantities (check for illegal duplicates)
         legality_warnings = self._validate_card_quantities(parsed_cards)
         if legality_warnings:
-            print(f"  ⚠️ Found {len(legality_warnings)} legality issue(s):")
+            log.warning(f"  ⚠️ Found {len(legality_warnings)} legality issue(s):")
             for warning in legality_warnings:
-                print(f"      {warning}")
+                log.warning(f"      {warning}")
         
-        # Step 2: Fetch card data from Scryfall
-        print("  🌐 Fetching card data from Scryfall...")
+        # Step 2: Fetch card data from Scryfall. The tutor database and the
+        # Game Changers list are independent network I/O, so they download
+        # on worker threads while the bulk card fetch runs - wall time
+        # becomes the slowest of the three fetches instead of their sum.
+        log.info("  🌐 Fetching card data from Scryfall...")
         card_names = [card["name"] for card in parsed_cards]
-        card_data_map = self.scryfall.get_cards_bulk(card_names)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            tutor_future = pool.submit(self.fetch_non_ramp_tutors)
+            gc_future = pool.submit(lambda: self.game_changers_set)
+            card_data_map = self.scryfall.get_cards_bulk(card_names)
+            tutor_future.result()  # Warms self._tutor_cache for Step 8
+            gc_future.result()     # Warms the Game Changers cache for Step 4
         
         # Step 3: Match parsed cards with fetched data
         all_cards = []
@@ -530,44 +895,111 @@ class DeckAnalyzer:
                 card_info["_quantity"] = quantity
                 all_cards.append(card_info)
         
-        print(f"  ✅ Found data for {len(all_cards)}/{len(parsed_cards)} cards")
-        
-        # Step 4: Detect commander (if not provided)
+        log.info(f"  ✅ Found data for {len(all_cards)}/{len(parsed_cards)} cards")
+
+        # Step 3.5: Normalize hot string fields once so downstream scans
+        # don't re-lowercase name/type/oracle text on every pass
+        self._prepare_cards(all_cards)
+
+        # Step 4: Fused scan - categorize by type, find Game Changers,
+        # mass land denial, extra turns, tutors, power-level cards, mana
+        # curve, and colors in ONE pass (the tutor cache is warm from
+        # Step 2, so fetch_non_ramp_tutors returns instantly here)
+        scan = self._scan_cards(all_cards, tutor_dict=self.fetch_non_ramp_tutors())
+        categorized = scan["categorized"]
+
+        # Step 5: Detect commander (if not provided). Standard Moxfield /
+        # Archidekt exports put the commander on the first line, so check
+        # that card before falling back to a scan - and scan creatures
+        # first, since commanders almost always are one.
         commander = commander_name
         if not commander and all_cards:
-            commander = self._detect_commander(all_cards)
-        
-        # Step 5: Categorize cards by type
-        categorized = self._categorize_cards(all_cards)
-        
-        # Step 5.5: Find MDFCs with land backs (for mana base evaluation)
-        mdfc_lands = self._find_mdfc_lands(all_cards)
+            first = all_cards[0]
+            if "legendary" in first["_type_lc"] and (
+                "creature" in first["_type_lc"]
+                or "can be your commander" in first["_oracle_lc"]
+            ):
+                commander = first.get("name", "Unknown")
+            else:
+                noncreatures = [
+                    card for card in all_cards
+                    if "creature" not in card["_type_lc"]
+                ]
+                commander = self._detect_commander(
+                    categorized["creatures"] + noncreatures
+                )
+
+        # Step 5.5: MDFCs with land backs (collected during the fused scan)
+        mdfc_lands = scan["mdfc_lands"]
         mdfc_land_count = self._count_cards(mdfc_lands)
-        land_count = self._count_cards(categorized["lands"])
+        land_count = scan["lands_quantity"]
         effective_land_count = land_count + mdfc_land_count
         
         if mdfc_lands:
             mdfc_names = [c.get("name", "").split(" // ")[0] for c in mdfc_lands]
-            print(f"  🃏 Found {len(mdfc_lands)} MDFC(s) with land backs: {', '.join(mdfc_names[:3])}{'...' if len(mdfc_names) > 3 else ''}")
-            print(f"      Lands: {land_count} ({effective_land_count} effective including MDFCs)")
-        
-        # Step 6: Find Game Changers
-        game_changers = self._find_game_changers(all_cards)
+            log.info(f"  🃏 Found {len(mdfc_lands)} MDFC(s) with land backs: {', '.join(mdfc_names[:3])}{'...' if len(mdfc_names) > 3 else ''}")
+            log.info(f"      Lands: {land_count} ({effective_land_count} effective including MDFCs)")
         
-        # Step 7: Find problematic cards (original)
-        mass_ld = self._find_cards_by_name(all_cards, MASS_LAND_DENIAL)
-        extra_turns = self._find_cards_by_name(all_cards, EXTRA_TURN_CARDS)
-        
-        # Step 8: ENHANCED - Classify tutors by tier
-        print("  🔍 Analyzing tutor density...")
-        tutor_breakdown = self._classify_tutors(all_cards)
+        # Step 6: Game Changers (collected during the fused scan)
+        game_changers = scan["game_changers"]
+
+        # Step 7: Problematic cards (collected during the fused scan)
+        mass_ld = scan["mass_land_denial"]
+        extra_turns = scan["extra_turns"]
+
+        # Fast path: if the caller only needs a bracket triage and the
+        # cheap signals already pin the deck at 4+, skip the combo
+        # lookup, cEDH scoring and archetype/theme/synergy passes
+        if fast_bracket_only and (len(game_changers) > 3 or mass_ld):
+            reasons = []
+            if len(game_changers) > 3:
+                reasons.append(
+                    f"📜 Has {len(game_changers)} Game Changers (>3 requires Bracket 4+)"
+                )
+            if mass_ld:
+                reasons.append(
+                    f"🏚️ Has {len(mass_ld)} mass land denial card(s)"
+                )
+            reasons.append("⏩ Fast bracket check - full analysis skipped")
+            log.info("  🎯 Fast bracket check: Bracket 4 (cheap signals)")
+            return DeckAnalysis(
+                commander=commander or "Unknown",
+                total_cards=scan["total_quantity"],
+                game_changers_found=game_changers,
+                game_changers_count=len(game_changers),
+                mass_land_denial_cards=mass_ld,
+                extra_turn_cards=extra_turns,
+                tutor_cards=[],
+                creatures=categorized["creatures"],
+                artifacts=categorized["artifacts"],
+                enchantments=categorized["enchantments"],
+                instants=categorized["instants"],
+                sorceries=categorized["sorceries"],
+                lands=categorized["lands"],
+                planeswalkers=categorized["planeswalkers"],
+                detected_archetypes=[],
+                color_identity=scan["color_identity"],
+                mana_curve=scan["mana_curve"],
+                average_cmc=scan["average_cmc"],
+                suggested_bracket=4,
+                bracket_reasoning=reasons,
+                all_cards=all_cards,
+                legality_warnings=legality_warnings,
+                mdfc_lands=mdfc_lands,
+                mdfc_land_count=mdfc_land_count,
+                effective_land_count=effective_land_count
+            )
+
+        # Step 8: ENHANCED - Tutor tiers (collected during the fused scan)
+        log.info("  🔍 Analyzing tutor density...")
+        tutor_breakdown = scan["tutor_breakdown"]
         tutor_score = self._calculate_tutor_score(tutor_breakdown)
-        all_tutors = (tutor_breakdown["premium"] + tutor_breakdown["efficient"] + 
+        all_tutors = (tutor_breakdown["premium"] + tutor_breakdown["efficient"] +
                       tutor_breakdown["standard"] + tutor_breakdown["slow"])
-        
-        # Step 9: ENHANCED - Find power level indicators
-        print("  ⚡ Detecting power level indicators...")
-        power_cards = self._find_power_level_cards(all_cards)
+
+        # Step 9: ENHANCED - Power level indicators (fused scan)
+        log.info("  ⚡ Detecting power level indicators...")
+        power_cards = scan["power_cards"]
         
         # Step 10: ENHANCED - Check cEDH commander status
         cedh_commander_tier = self._check_cedh_commander(commander)
@@ -575,17 +1007,18 @@ class DeckAnalyzer:
         # Step 11: Detect archetypes
         archetypes = self._detect_archetypes(all_cards)
         
-        # Step 12: Calculate mana curve
-        mana_curve, avg_cmc = self._calculate_mana_curve(all_cards)
-        
-        # Step 13: Determine color identity
-        color_identity = self._get_color_identity(all_cards)
+        # Step 12: Mana curve (collected during the fused scan)
+        mana_curve = scan["mana_curve"]
+        avg_cmc = scan["average_cmc"]
+
+        # Step 13: Color identity (collected during the fused scan)
+        color_identity = scan["color_identity"]
         
         # Step 14: ENHANCED - Fetch combos from Commander Spellbook
         combo_data = self._fetch_combos(all_cards, commander)
         
         # Step 15: ENHANCED - Calculate cEDH signals
-        print("  🎯 Calculating cEDH signals...")
+        log.info("  🎯 Calculating cEDH signals...")
         cedh_signals, cedh_breakdown = self._calculate_cedh_signals(
             commander=commander,
             cedh_commander_tier=cedh_commander_tier,
@@ -615,8 +1048,8 @@ class DeckAnalyzer:
                 has_mass_land_denial=len(mass_ld) > 0  # Only hard disqualifier for B1
             )
             if bracket1_likelihood >= 50:
-                print(f"  🎨 Bracket 1 signals detected: {bracket1_likelihood:.0f}% likelihood")
-                print(f"      {b1_reason}")
+                log.info(f"  🎨 Bracket 1 signals detected: {bracket1_likelihood:.0f}% likelihood")
+                log.info(f"      {b1_reason}")
         
         # Step 17: ENHANCED - Calculate bracket with all new data
         bracket, reasoning = self._calculate_bracket_enhanced(
@@ -634,13 +1067,13 @@ class DeckAnalyzer:
             bracket1_likelihood=bracket1_likelihood
         )
         
-        print(f"  🎯 Analysis complete! Suggested bracket: {bracket}")
-        if cedh_signals >= BRACKET_SCORING["cedh_signal_threshold"]:
-            print(f"  ⚠️  cEDH signals detected: {cedh_signals} points")
+        log.info(f"  🎯 Analysis complete! Suggested bracket: {bracket}")
+        if cedh_signals >= BRACKET_SCORING.cedh_signal_threshold:
+            log.warning(f"  ⚠️  cEDH signals detected: {cedh_signals} points")
         
-        return DeckAnalysis(
+        analysis = DeckAnalysis(
             commander=commander or "Unknown",
-            total_cards=self._count_cards(all_cards),
+            total_cards=scan["total_quantity"],
             game_changers_found=game_changers,
             game_changers_count=len(game_changers),
             mass_land_denial_cards=mass_ld,
@@ -691,7 +1124,231 @@ class DeckAnalyzer:
             mdfc_land_count=mdfc_land_count,
             effective_land_count=effective_land_count
         )
-    
+
+        self._analysis_cache[cache_key] = analysis
+        return analysis
+
+    def _analysis_cache_key(self, decklist_text: str, commander_name: Optional[str]) -> str:
+        """
+        Build a stable cache key for a (decklist, commander) pair.
+
+        The decklist is normalized (trimmed, lowercased, blank lines
+        dropped) so cosmetic whitespace differences still hit the cache.
+        """
+        normalized = "\n".join(
+            line.strip().lower()
+            for line in decklist_text.splitlines()
+            if line.strip()
+        )
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{digest}:{(commander_name or '').lower()}"
+
+    def _prepare_cards(self, cards: List[Dict[str, Any]]) -> None:
+        """
+        Precompute lowercased string fields on each card dict.
+
+        The analysis passes (game changers, mass land denial, tutors,
+        archetypes, ...) all match against lowercase text. Computing the
+        lowercase copies once here means each pass does a plain dict read
+        instead of allocating a fresh lowercase string per card per pass.
+
+        The cached fields use a leading underscore (like _quantity) to mark
+        them as our additions to the Scryfall data.
+        """
+        for card in cards:
+            # _lc memoizes + interns, so repeated names/type lines across
+            # decks cost a dict hit, and set membership against the (also
+            # interned) lookup frozensets is usually a pointer compare.
+            # Oracle text is long and unique per card - plain lower().
+            name = card.get("name", "")
+            if name:
+                # Scryfall-sourced names are already interned at fetch
+                # time; this covers cards from other sources (no-op when
+                # the string is interned already)
+                card["name"] = sys.intern(name)
+            card["_name_lc"] = _lc(name)
+            type_lc = _lc(card.get("type_line", ""))
+            card["_type_lc"] = type_lc
+            # Creature flag + pre-split subtypes for the synergy fallback,
+            # so its loop does no substring scans or split allocations
+            is_creature = "creature" in type_lc and "basic" not in type_lc
+            card["_is_creature"] = is_creature
+            if is_creature and "—" in type_lc:
+                card["_subtypes"] = tuple(type_lc.split("—")[1].strip().split())
+            else:
+                card["_subtypes"] = ()
+            oracle_lc = card.get("oracle_text", "").lower()
+            card["_oracle_lc"] = oracle_lc
+            # Oracle text + keywords, the corpus archetype detection scans.
+            # Built once so no pass re-joins (or re-lowercases) per card.
+            keywords = card.get("keywords", [])
+            if keywords:
+                card["_searchable"] = oracle_lc + " " + " ".join(
+                    _lc(kw) for kw in keywords
+                )
+            else:
+                card["_searchable"] = oracle_lc
+            card["_color_mask"] = sum(
+                _COLOR_BIT[c] for c in card.get("color_identity", []) if c in _COLOR_BIT
+            )
+            # Scryfall ships cmc as a float (3.0) - convert once here so
+            # the curve loops do plain integer adds, and pre-bucket the
+            # 7+ grouping while we're at it
+            cmc_int = int(card.get("cmc", 0) or 0)
+            card["_cmc_int"] = cmc_int
+            card["_cmc_bucket"] = cmc_int if cmc_int < 7 else 7
+
+    def _scan_cards(
+        self,
+        cards: List[Dict[str, Any]],
+        tutor_dict: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Single fused pass over the deck that feeds several accumulators.
+
+        analyze_deck used to walk all_cards once per question: categorize,
+        find Game Changers, find mass land denial, find extra turns,
+        build the mana curve, collect colors. Each of those passes
+        re-touched every card dict. One loop updating all the accumulators
+        reads each card exactly once.
+
+        Returns a dict with the results of all the fused sub-analyses.
+        The standalone methods (_categorize_cards, _find_game_changers,
+        ...) still exist for callers that only need one answer.
+        """
+        categories = {
+            "creatures": [],
+            "artifacts": [],
+            "enchantments": [],
+            "instants": [],
+            "sorceries": [],
+            "lands": [],
+            "planeswalkers": [],
+            "other": []
+        }
+        gc_set = self.game_changers_set
+        game_changers = []
+        mass_ld = []
+        extra_turns = []
+        mdfc_lands = []
+        # Fixed-size histogram (buckets 0-7, with 7 = "7+"): indexed adds
+        # into a preallocated list instead of dict get/set per card
+        curve_counts = [0] * 8
+        total_cmc = 0
+        nonland_count = 0
+        color_mask = 0
+        total_quantity = 0
+        lands_quantity = 0
+        # Tutor tiers and power-level buckets ride along in the same pass.
+        # Tutors need the Scryfall tutor dict, so they're classified only
+        # when the caller supplies one.
+        tutor_breakdown = {
+            "premium": [],
+            "efficient": [],
+            "standard": [],
+            "slow": []
+        }
+        power_cards = {
+            "fast_mana": [],
+            "free_interaction": [],
+            "high_power_staples": [],
+            "competitive_stax": []
+        }
+
+        for card in cards:
+            name = card.get("name")
+            name_lc = card["_name_lc"]
+            type_lc = card["_type_lc"]
+            quantity = card.get("_quantity", 1)
+            total_quantity += quantity
+
+            # Tokenize the primary types once - "legendary creature — elf"
+            # becomes {"legendary", "creature"}. Scryfall type lines have a
+            # fixed grammar, so splitting off the subtype half and testing
+            # set membership replaces chained substring scans.
+            type_tokens = set(type_lc.split(" — ", 1)[0].split())
+
+            # Tag commander eligibility once so _detect_commander does no
+            # string work of its own
+            card["_is_legendary_creature"] = (
+                "legendary" in type_tokens and "creature" in type_tokens
+            )
+            card["_can_be_commander"] = "can be your commander" in card["_oracle_lc"]
+
+            for type_token, category in _TYPE_PRIORITY:
+                if type_token in type_tokens:
+                    categories[category].append(card)
+                    if category == "lands":
+                        lands_quantity += quantity
+                    break
+            else:
+                categories["other"].append(card)
+
+            # Name-based lookups against precomputed frozensets
+            if name_lc in gc_set:
+                game_changers.append(name)
+            if name_lc in MASS_LAND_DENIAL_SET:
+                mass_ld.append(name)
+            if name_lc in EXTRA_TURN_CARDS_SET:
+                extra_turns.append(name)
+
+            # Power-level buckets from the shared category table (a card
+            # can land in several, e.g. Chrome Mox)
+            for tag in CARD_CATEGORIES.get(name_lc, ()):
+                bucket = power_cards.get(tag)
+                if bucket is not None:
+                    bucket.append(name)
+
+            if tutor_dict is not None:
+                self._classify_tutor_card(
+                    card, name, name_lc, tutor_dict, tutor_breakdown
+                )
+
+            # MDFCs with a land back (spell front, land back) count toward
+            # the effective mana base. The cheap layout check runs first so
+            # the >95% of cards that aren't modal DFCs skip the face lookups.
+            is_mdfc_land = False
+            if card.get("layout", "") == "modal_dfc":
+                card_faces = card.get("card_faces", [])
+                if len(card_faces) >= 2:
+                    back_type = card_faces[1].get("type_line", "")
+                    front_type = card_faces[0].get("type_line", "")
+                    if "Land" in back_type and "Land" not in front_type:
+                        is_mdfc_land = True
+                        mdfc_lands.append(card)
+            card["_is_mdfc_land"] = is_mdfc_land
+
+            # Mana curve (lands excluded, 7+ grouped together) - the int
+            # conversion and bucketing happened once in _prepare_cards
+            if "land" not in type_lc:
+                curve_counts[card["_cmc_bucket"]] += quantity
+                total_cmc += card["_cmc_int"] * quantity
+                nonland_count += quantity
+
+            color_mask |= card["_color_mask"]
+
+        average = total_cmc / nonland_count if nonland_count > 0 else 0
+
+        return {
+            "categorized": categories,
+            "game_changers": game_changers,
+            "mass_land_denial": mass_ld,
+            "extra_turns": extra_turns,
+            "mdfc_lands": mdfc_lands,
+            # Quantity totals, so analyze_deck doesn't re-sum card lists
+            "total_quantity": total_quantity,
+            "lands_quantity": lands_quantity,
+            # Convert the histogram to the sparse dict shape callers expect
+            "mana_curve": {cmc: count for cmc, count in enumerate(curve_counts) if count},
+            "average_cmc": round(average, 2),
+            # Unpack the OR-reduced mask back into WUBRG order
+            "color_identity": [c for c, bit in _COLOR_BIT.items() if color_mask & bit],
+            "power_cards": power_cards,
+            # None when no tutor dict was supplied - callers then fall back
+            # to the standalone _classify_tutors
+            "tutor_breakdown": tutor_breakdown if tutor_dict is not None else None,
+        }
+
     def _detect_commander(self, cards: List[Dict[str, Any]]) -> str:
         """
         Try to automatically detect the commander from the deck.
@@ -700,17 +1357,24 @@ class DeckAnalyzer:
         permanents with special rules text).
         """
         for card in cards:
+            # Cards that went through _scan_cards carry precomputed flags -
+            # checking those skips all per-card string work
+            if "_is_legendary_creature" in card:
+                if card["_is_legendary_creature"] or card["_can_be_commander"]:
+                    return card.get("name", "Unknown")
+                continue
+
             type_line = card.get("type_line", "").lower()
-            
+
             # Check if it's legendary and a creature
             if "legendary" in type_line and "creature" in type_line:
                 return card.get("name", "Unknown")
-            
+
             # Some commanders have special text like "can be your commander"
             oracle_text = card.get("oracle_text", "").lower()
             if "can be your commander" in oracle_text:
                 return card.get("name", "Unknown")
-        
+
         return None
     
     def _categorize_cards(self, cards: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -731,26 +1395,19 @@ class DeckAnalyzer:
         }
         
         for card in cards:
-            type_line = card.get("type_line", "").lower()
-            
-            # Check each type (order matters for multi-type cards)
-            if "creature" in type_line:
-                categories["creatures"].append(card)
-            elif "instant" in type_line:
-                categories["instants"].append(card)
-            elif "sorcery" in type_line:
-                categories["sorceries"].append(card)
-            elif "artifact" in type_line:
-                categories["artifacts"].append(card)
-            elif "enchantment" in type_line:
-                categories["enchantments"].append(card)
-            elif "land" in type_line:
-                categories["lands"].append(card)
-            elif "planeswalker" in type_line:
-                categories["planeswalkers"].append(card)
+            type_line = _lc(card.get("type_line", ""))
+
+            # Tokenized primary types + priority dispatch, mirroring the
+            # fused scan (order matters for multi-type cards)
+            type_tokens = set(type_line.split(" — ", 1)[0].split())
+
+            for type_token, category in _TYPE_PRIORITY:
+                if type_token in type_tokens:
+                    categories[category].append(card)
+                    break
             else:
                 categories["other"].append(card)
-        
+
         return categories
     
     def _find_game_changers(self, cards: List[Dict[str, Any]]) -> List[str]:
@@ -759,32 +1416,19 @@ class DeckAnalyzer:
         
         Returns the names of Game Changer cards found.
         """
-        found = []
-        
-        for card in cards:
-            name = card.get("name", "").lower()
-            
-            if name in self.game_changers_set:
-                found.append(card.get("name"))
-        
-        return found
+        # List comprehension: the membership filter runs on a specialized
+        # opcode instead of a repeated bound-method append lookup
+        gcs = self.game_changers_set
+        return [card.get("name") for card in cards if card["_name_lc"] in gcs]
     
-    def _find_cards_by_name(self, cards: List[Dict[str, Any]], target_list: List[str]) -> List[str]:
+    def _find_cards_by_name(self, cards: List[Dict[str, Any]], target_set: Set[str]) -> List[str]:
         """
-        Find cards whose names match a target list.
-        
-        Used for finding mass land denial, extra turns, etc.
+        Find cards whose names match a target set of lowercase names.
+
+        Used for finding mass land denial, extra turns, etc. The target
+        sets are precomputed (lowercased) once at import time in config.py.
         """
-        # Normalize the target list to lowercase for matching
-        target_set = {name.lower() for name in target_list}
-        
-        found = []
-        for card in cards:
-            name = card.get("name", "").lower()
-            if name in target_set:
-                found.append(card.get("name"))
-        
-        return found
+        return [card.get("name") for card in cards if card["_name_lc"] in target_set]
     
     def _detect_archetypes(self, cards: List[Dict[str, Any]]) -> List[str]:
         """
@@ -793,33 +1437,62 @@ class DeckAnalyzer:
         This uses keyword matching on oracle text to identify
         common Commander archetypes.
         """
-        # Count how many cards match each archetype's keywords
-        archetype_scores = {archetype: 0 for archetype in ARCHETYPE_KEYWORDS}
-        
-        for card in cards:
-            oracle_text = card.get("oracle_text", "").lower()
-            keywords = card.get("keywords", [])
-            
-            # Combine oracle text and keywords for searching
-            searchable = oracle_text + " " + " ".join(kw.lower() for kw in keywords)
-            
-            for archetype, indicators in ARCHETYPE_KEYWORDS.items():
-                for indicator in indicators:
-                    if indicator.lower() in searchable:
-                        archetype_scores[archetype] += 1
-                        break  # Don't double-count same card
-        
-        # Return archetypes with significant presence (at least 5 cards)
+        # Flat per-archetype hit counters indexed by archetype id - an
+        # indexed add replaces a dict/Counter string hash per increment
+        scores = [0] * len(_ARCH_NAMES)
+        automaton = _get_archetype_automaton()
+
+        # Scores only rank and threshold the archetypes, so once one banks
+        # double the reporting threshold we stop counting it: its relative
+        # order among other saturated archetypes is frozen at that point
+        # (exact scores above the cap don't matter), and tribal-heavy
+        # decks skip the indicator work for their dominant theme.
         threshold = 15
-        detected = [
-            archetype for archetype, score in archetype_scores.items()
-            if score >= threshold
-        ]
-        
-        # Sort by score (most prominent first)
-        detected.sort(key=lambda a: archetype_scores[a], reverse=True)
-        
-        return detected
+        saturation_cap = threshold * 2
+        saturated: Set[int] = set()
+
+        for card in cards:
+            # Prepared cards carry the combined oracle+keywords corpus;
+            # build it on the fly only for raw dicts
+            searchable = card.get("_searchable")
+            if searchable is None:
+                oracle_text = card.get("oracle_text", "").lower()
+                keywords = card.get("keywords", [])
+                searchable = oracle_text + " " + " ".join(kw.lower() for kw in keywords)
+
+            # Single-word indicators match against the tokenized text in
+            # O(1) per archetype instead of a substring scan per indicator
+            tokens = set(_TOKEN_RE.findall(searchable))
+            matched = {
+                arch_id
+                for arch_id, singles in enumerate(_SINGLE_WORDS_BY_ID)
+                if arch_id not in saturated and tokens & singles
+            }
+
+            # Multi-word phrases still need substring matching
+            if automaton is not None:
+                # One automaton pass finds every phrase in the text at once
+                for _, owners in automaton.iter(searchable):
+                    matched.update(owners)
+                matched -= saturated
+            else:
+                for arch_id, pattern in enumerate(_PHRASE_RE_BY_ID):
+                    if pattern is None or arch_id in matched or arch_id in saturated:
+                        continue  # No phrases, already counted, or capped out
+                    if pattern.search(searchable):
+                        matched.add(arch_id)
+
+            for arch_id in matched:  # Once per card
+                new_score = scores[arch_id] + 1
+                scores[arch_id] = new_score
+                if new_score >= saturation_cap:
+                    saturated.add(arch_id)
+
+        # Rank the over-threshold archetypes by score, most prominent
+        # first (the stable sort keeps config order on ties, matching
+        # the old Counter insertion order)
+        order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        return [_ARCH_NAMES[i] for i in order if scores[i] >= threshold]
     
     def _calculate_mana_curve(self, cards: List[Dict[str, Any]]) -> Tuple[Dict[int, int], float]:
         """
@@ -829,30 +1502,32 @@ class DeckAnalyzer:
             Tuple of (curve_dict, average_cmc)
             curve_dict maps mana value to count of cards
         """
-        curve = {}
+        # Fixed-size histogram: buckets 0-7, with 7 grouped as "7+"
+        curve_counts = [0] * 8
         total_cmc = 0
         nonland_count = 0
-        
+
         for card in cards:
             type_line = card.get("type_line", "").lower()
-            
+
             # Skip lands for mana curve calculation
             if "land" in type_line:
                 continue
-            
-            cmc = int(card.get("cmc", 0))
+
+            # Prepared cards carry the int CMC; fall back for raw dicts
+            cmc = card.get("_cmc_int")
+            if cmc is None:
+                cmc = int(card.get("cmc", 0))
             quantity = card.get("_quantity", 1)
-            
-            # Group 7+ together as "7+"
-            display_cmc = min(cmc, 7)
-            curve[display_cmc] = curve.get(display_cmc, 0) + quantity
-            
+
+            curve_counts[min(cmc, 7)] += quantity
             total_cmc += cmc * quantity
             nonland_count += quantity
-        
+
         # Calculate average
         average = total_cmc / nonland_count if nonland_count > 0 else 0
-        
+
+        curve = {cmc: count for cmc, count in enumerate(curve_counts) if count}
         return curve, round(average, 2)
     
     def _get_color_identity(self, cards: List[Dict[str, Any]]) -> List[str]:
@@ -862,15 +1537,19 @@ class DeckAnalyzer:
         In Commander, color identity is the union of all colors
         used by all cards (including mana symbols in text).
         """
-        all_colors = set()
-        
+        mask = 0
+
         for card in cards:
-            colors = card.get("color_identity", [])
-            all_colors.update(colors)
-        
-        # Return in WUBRG order
-        order = ["W", "U", "B", "R", "G"]
-        return [c for c in order if c in all_colors]
+            # Prepared cards carry the 5-bit mask; OR is one int op
+            cached = card.get("_color_mask")
+            if cached is not None:
+                mask |= cached
+            else:
+                for color in card.get("color_identity", []):
+                    mask |= _COLOR_BIT.get(color, 0)
+
+        # Return in WUBRG order (the _COLOR_BIT insertion order)
+        return [c for c, bit in _COLOR_BIT.items() if mask & bit]
     
     # =========================================================================
     # NEW ENHANCED ANALYSIS METHODS
@@ -895,59 +1574,75 @@ class DeckAnalyzer:
             "slow": []
         }
         
-        # Build lookup sets from config (lowercase for matching)
-        premium_set = {name.lower() for name in TUTORS_PREMIUM}
-        efficient_set = {name.lower() for name in TUTORS_EFFICIENT}
-        standard_set = {name.lower() for name in TUTORS_STANDARD}
-        slow_set = {name.lower() for name in TUTORS_SLOW}
-        
         # Get authoritative tutor list from Scryfall
         scryfall_tutors = self.fetch_non_ramp_tutors()
-        
+
         for card in cards:
             name = card.get("name", "")
-            name_lower = name.lower()
-            
-            # Check if this card is a tutor (using Scryfall's tags)
-            is_tutor = name in scryfall_tutors
-            
-            # Also check DFC front face
-            if not is_tutor and " // " in name:
-                front_face = name.split(" // ")[0]
-                is_tutor = front_face in scryfall_tutors
-            
-            if not is_tutor:
-                continue
-            
-            # Now classify the tutor by tier
-            # First check our predefined lists
-            if name_lower in premium_set:
+            name_lower = card.get("_name_lc") or name.lower()
+            self._classify_tutor_card(card, name, name_lower, scryfall_tutors, result)
+
+        return result
+
+    def _classify_tutor_card(
+        self,
+        card: Dict[str, Any],
+        name: str,
+        name_lower: str,
+        scryfall_tutors: Dict[str, Dict[str, Any]],
+        result: Dict[str, List[str]]
+    ) -> None:
+        """
+        Classify one card into a tutor tier bucket, if it is a tutor.
+
+        Shared between the fused _scan_cards pass and the standalone
+        _classify_tutors so the two stay in lockstep.
+        """
+        # Known ramp staples are never tutors - skip them outright
+        if name_lower in _RAMP_BLACKLIST:
+            return
+
+        # Check if this card is a tutor (using Scryfall's tags). One .get
+        # fetches the entry and answers membership; the DFC split only
+        # runs for the minority of names that actually contain " // "
+        # and missed on the full name.
+        entry = scryfall_tutors.get(name)
+        front_face_hit = False
+        if entry is None and " // " in name:
+            entry = scryfall_tutors.get(name.split(" // ")[0])
+            front_face_hit = True
+
+        if entry is None:
+            return
+
+        # Now classify the tutor by tier
+        # First check our predefined lists (module-level frozensets)
+        if name_lower in _TUTORS_PREMIUM_LC:
+            result["premium"].append(name)
+        elif name_lower in _TUTORS_EFFICIENT_LC:
+            result["efficient"].append(name)
+        elif name_lower in _TUTORS_STANDARD_LC:
+            result["standard"].append(name)
+        elif name_lower in _TUTORS_SLOW_LC:
+            result["slow"].append(name)
+        else:
+            # Tutor not in our lists - auto-classify by CMC. The entry we
+            # already fetched has the Scryfall CMC; only a front-face-only
+            # hit falls back to the deck's own card data.
+            if front_face_hit:
+                cmc = card.get("cmc", 4)
+            else:
+                cmc = entry.get("cmc", 4)
+
+            # Classify by mana cost
+            if cmc <= 1:
                 result["premium"].append(name)
-            elif name_lower in efficient_set:
+            elif cmc <= 2:
                 result["efficient"].append(name)
-            elif name_lower in standard_set:
+            elif cmc <= 3:
                 result["standard"].append(name)
-            elif name_lower in slow_set:
-                result["slow"].append(name)
             else:
-                # Tutor not in our lists - auto-classify by CMC
-                # Get CMC from Scryfall data or card data
-                if name in scryfall_tutors:
-                    cmc = scryfall_tutors[name].get("cmc", 4)
-                else:
-                    cmc = card.get("cmc", 4)
-                
-                # Classify by mana cost
-                if cmc <= 1:
-                    result["premium"].append(name)
-                elif cmc <= 2:
-                    result["efficient"].append(name)
-                elif cmc <= 3:
-                    result["standard"].append(name)
-                else:
-                    result["slow"].append(name)
-        
-        return result
+                result["slow"].append(name)
     
     def _calculate_tutor_score(self, tutor_breakdown: Dict[str, List[str]]) -> float:
         """
@@ -955,12 +1650,10 @@ class DeckAnalyzer:
         
         Premium tutors count for more since they enable faster, more consistent wins.
         """
-        score = 0.0
-        score += len(tutor_breakdown["premium"]) * BRACKET_SCORING["tutor_premium_weight"]
-        score += len(tutor_breakdown["efficient"]) * BRACKET_SCORING["tutor_efficient_weight"]
-        score += len(tutor_breakdown["standard"]) * BRACKET_SCORING["tutor_standard_weight"]
-        score += len(tutor_breakdown["slow"]) * BRACKET_SCORING["tutor_slow_weight"]
-        return score
+        return sum(
+            len(tutor_breakdown[tier]) * weight
+            for tier, weight in zip(_TUTOR_TIER_ORDER, _TUTOR_WEIGHTS)
+        )
     
     def _find_power_level_cards(self, cards: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """
@@ -974,26 +1667,15 @@ class DeckAnalyzer:
             "high_power_staples": [],
             "competitive_stax": []
         }
-        
-        # Build lookup sets
-        fast_mana_set = {name.lower() for name in FAST_MANA}
-        free_int_set = {name.lower() for name in FREE_INTERACTION}
-        staples_set = {name.lower() for name in HIGH_POWER_STAPLES}
-        stax_set = {name.lower() for name in COMPETITIVE_STAX}
-        
+
+        # One pass using the shared category table from config.py
+        # (a card can land in multiple buckets, e.g. Chrome Mox)
         for card in cards:
             name = card.get("name", "")
-            name_lower = name.lower()
-            
-            if name_lower in fast_mana_set:
-                result["fast_mana"].append(name)
-            if name_lower in free_int_set:
-                result["free_interaction"].append(name)
-            if name_lower in staples_set:
-                result["high_power_staples"].append(name)
-            if name_lower in stax_set:
-                result["competitive_stax"].append(name)
-        
+            for tag in CARD_CATEGORIES.get(name.lower(), ()):
+                if tag in result:
+                    result[tag].append(name)
+
         return result
     
     def _check_cedh_commander(self, commander: str) -> int:
@@ -1009,17 +1691,22 @@ class DeckAnalyzer:
             return 0
         
         commander_lower = commander.lower()
-        
-        # Check tier 1
-        for name in CEDH_COMMANDERS_TIER1:
-            if name.lower() in commander_lower or commander_lower in name.lower():
+
+        # Exact name: one dict probe covers the common case
+        tier = _CEDH_TIER_MAP.get(commander_lower)
+        if tier is not None:
+            return tier
+
+        # Fallback for partial names ("Kinnan" vs the full card name),
+        # tier 1 checked first as before
+        for name in _CEDH_TIER1_LC:
+            if name in commander_lower or commander_lower in name:
                 return 1
-        
-        # Check tier 2
-        for name in CEDH_COMMANDERS_TIER2:
-            if name.lower() in commander_lower or commander_lower in name.lower():
+
+        for name in _CEDH_TIER2_LC:
+            if name in commander_lower or commander_lower in name:
                 return 2
-        
+
         return 0
     
     def _detect_theme_restrictions(self, cards: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -1045,13 +1732,13 @@ class DeckAnalyzer:
                 "restriction_description": None
             }
         
-        print("  🎨 Checking for theme restrictions...")
+        log.info("  🎨 Checking for theme restrictions...")
         detector = ThemeDetector()
         result = detector.detect_themes(cards)
         
         if result["detected_themes"]:
-            print(f"      Detected: {', '.join(result['detected_themes'])}")
-            print(f"      Restriction score: {result['restriction_score']:.1f}")
+            log.info(f"      Detected: {', '.join(result['detected_themes'])}")
+            log.info(f"      Restriction score: {result['restriction_score']:.1f}")
         
         return result
     
@@ -1077,7 +1764,7 @@ class DeckAnalyzer:
             from synergy import SynergyAnalyzer
             analyzer = SynergyAnalyzer()
             score = analyzer.calculate_synergy_score(cards)
-            print(f"  🔗 Synergy score: {score:.1f}")
+            log.info(f"  🔗 Synergy score: {score:.1f}")
             return score
         except ImportError:
             # Fallback: basic synergy calculation
@@ -1091,27 +1778,31 @@ class DeckAnalyzer:
         - Creature type concentration (tribal)
         - Keyword concentration
         """
-        from collections import Counter
-        
-        # Get creature subtypes
-        subtypes = []
+        # Tally creature subtypes as we go - updating the Counter inline
+        # skips the intermediate subtype list (and its re-hash in Counter())
+        counts = Counter()
         creature_count = 0
-        
+
         for card in cards:
+            # Prepared cards carry the flag and pre-split subtype tuple
+            if "_is_creature" in card:
+                if card["_is_creature"]:
+                    creature_count += 1
+                    counts.update(card["_subtypes"])
+                continue
+
             type_line = card.get("type_line", "")
             if "Creature" in type_line and "Basic" not in type_line:
                 creature_count += 1
                 if "—" in type_line:
-                    parts = type_line.split("—")[1].strip().split()
-                    subtypes.extend(parts)
-        
+                    counts.update(type_line.split("—")[1].strip().split())
+
         if creature_count < 10:
             return 0.0
-        
-        # Find most common subtype
-        if subtypes:
-            counts = Counter(subtypes)
-            _, top_count = counts.most_common(1)[0]
+
+        # Find most common subtype (max over the values - no sort or heap)
+        if counts:
+            top_count = max(counts.values())
             tribal_density = (top_count / creature_count) * 100
             return tribal_density
         
@@ -1138,19 +1829,42 @@ class DeckAnalyzer:
         
         if not SPELLBOOK_AVAILABLE:
             error_msg = SPELLBOOK_IMPORT_ERROR or "Unknown error"
-            print(f"  ⚠️  Commander Spellbook client not available: {error_msg}")
-            print(f"      Make sure spellbook_client.py is in the same directory")
+            log.warning(f"  ⚠️  Commander Spellbook client not available: {error_msg}")
+            log.warning(f"      Make sure spellbook_client.py is in the same directory")
             return result
         
-        print("  🔍 Checking Commander Spellbook for combos...", flush=True)
-        
+        log.info("  🔍 Checking Commander Spellbook for combos...")
+
+        # Filter out empty names and dedupe (dict.fromkeys keeps order):
+        # basics and "any number" cards appear once per copy in all_cards,
+        # and duplicate entries just bloat the API payload - combo
+        # membership only cares whether a name is present.
+        card_names = list(dict.fromkeys(
+            card.get("name", "") for card in cards if card.get("name")
+        ))
+
+        # Content hash of the deck: the same 100 cards + commander always
+        # produce the same combos, so cache hits skip the network entirely
+        # (commander can be None when detection found nothing - same as
+        # the commanders=None passed to the API below)
+        deck_key = hashlib.blake2b(
+            "\n".join(sorted(n.lower() for n in card_names)).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest() + ":" + (commander or "").lower()
+
+        cached = self._combo_cache.get(deck_key)
+        if cached is not None:
+            log.info("  ✅ Using cached combo results")
+            return cached
+
+        cached = self._load_combo_cache_from_disk(deck_key)
+        if cached is not None:
+            log.info("  ✅ Loaded combo results from disk cache")
+            self._combo_cache[deck_key] = cached
+            return cached
+
         try:
             client = SpellbookClient()
-            card_names = [card.get("name", "") for card in cards]
-            
-            # Filter out empty names
-            card_names = [n for n in card_names if n]
-            
             combos = client.find_combos(
                 card_names=card_names,
                 commanders=[commander] if commander else None
@@ -1182,8 +1896,9 @@ class DeckAnalyzer:
                         combo.suggested_bracket
                     )
                 
-                # Process near-miss combos
-                for combo in combos.almost_included[:10]:  # Limit to 10
+                # Process near-miss combos (islice caps at 10 without
+                # materializing a slice copy of the full list)
+                for combo in islice(combos.almost_included, 10):
                     combo_info = {
                         "cards": combo.card_names,
                         "produces": combo.produces,
@@ -1192,16 +1907,70 @@ class DeckAnalyzer:
                     result["almost_included"].append(combo_info)
                 
                 if result["combo_count"] > 0:
-                    print(f"  ✅ Found {result['combo_count']} verified combo(s)")
+                    log.info(f"  ✅ Found {result['combo_count']} verified combo(s)")
                 else:
-                    print(f"  ✅ No combos found in Spellbook database")
+                    log.info(f"  ✅ No combos found in Spellbook database")
             else:
-                print(f"  ✅ No combos found in Spellbook database")
-                
+                # find_combos returns None when the API call or response
+                # parse failed - that's an error, not "zero combos"
+                log.warning("  ⚠️  Combo lookup failed, will retry next analysis")
+
+            # Only successful lookups are cached - an error result would
+            # otherwise mask combos for a full TTL
+            if combos is not None:
+                self._combo_cache[deck_key] = result
+                self._save_combo_cache_to_disk(deck_key, result)
+
         except Exception as e:
-            print(f"  ⚠️  Error fetching combos: {e}")
-        
+            log.warning(f"  ⚠️  Error fetching combos: {e}")
+
         return result
+
+    def _load_combo_cache_from_disk(self, deck_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a combo result for this deck hash from the on-disk cache.
+
+        Returns None when the file is missing, the entry is absent or
+        older than a day, or the JSON is unreadable.
+        """
+        try:
+            with open(_COMBO_CACHE_FILE, "r", encoding="utf-8") as f:
+                store = json.load(f)
+            entry = store.get(deck_key)
+            if not entry:
+                return None
+            if time.time() - entry.get("timestamp", 0) > _COMBO_CACHE_MAX_AGE_SECONDS:
+                return None
+            return entry.get("data")
+        except (OSError, ValueError):
+            return None
+
+    def _save_combo_cache_to_disk(self, deck_key: str, result: Dict[str, Any]) -> None:
+        """
+        Write a combo result to the on-disk cache (best effort).
+
+        Expired entries are pruned on each write so the file stays small.
+        """
+        try:
+            store = {}
+            try:
+                with open(_COMBO_CACHE_FILE, "r", encoding="utf-8") as f:
+                    store = json.load(f)
+            except (OSError, ValueError):
+                store = {}
+
+            now = time.time()
+            store = {
+                key: entry for key, entry in store.items()
+                if now - entry.get("timestamp", 0) <= _COMBO_CACHE_MAX_AGE_SECONDS
+            }
+            store[deck_key] = {"timestamp": now, "data": result}
+
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(_COMBO_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(store, f)
+        except OSError:
+            pass
     
     def _calculate_cedh_signals(
         self,
@@ -1233,7 +2002,7 @@ class DeckAnalyzer:
             breakdown["cedh_commander_tier2"] = 2
         
         # Fast mana signals (+1 per piece)
-        if fast_mana_count >= BRACKET_SCORING["fast_mana_cedh_threshold"]:
+        if fast_mana_count >= BRACKET_SCORING.fast_mana_cedh_threshold:
             bonus = fast_mana_count
             signals += bonus
             breakdown["fast_mana"] = bonus
@@ -1242,21 +2011,21 @@ class DeckAnalyzer:
             breakdown["fast_mana"] = fast_mana_count - 2
         
         # Free interaction signals
-        if free_interaction_count >= BRACKET_SCORING["free_interaction_cedh_threshold"]:
+        if free_interaction_count >= BRACKET_SCORING.free_interaction_cedh_threshold:
             bonus = free_interaction_count
             signals += bonus
             breakdown["free_interaction"] = bonus
         
         # Low average CMC signals
-        if avg_cmc < BRACKET_SCORING["avg_cmc_cedh"]:
+        if avg_cmc < BRACKET_SCORING.avg_cmc_cedh:
             signals += 2
             breakdown["low_avg_cmc"] = 2
-        elif avg_cmc < BRACKET_SCORING["avg_cmc_optimized"]:
+        elif avg_cmc < BRACKET_SCORING.avg_cmc_optimized:
             signals += 1
             breakdown["optimized_curve"] = 1
         
         # Low land count signal
-        if land_count <= BRACKET_SCORING["lands_cedh_max"]:
+        if land_count <= BRACKET_SCORING.lands_cedh_max:
             signals += 1
             breakdown["low_land_count"] = 1
         
@@ -1347,7 +2116,7 @@ class DeckAnalyzer:
         # =====================================================================
         # CHECK FOR BRACKET 5 (cEDH)
         # =====================================================================
-        if cedh_signals >= BRACKET_SCORING["cedh_signal_threshold"]:
+        if cedh_signals >= BRACKET_SCORING.cedh_signal_threshold:
             bracket = 5
             reasons.append(f"⚡ cEDH signals detected ({cedh_signals} points)")
             reasons.append("  Deck appears optimized for competitive play")
@@ -1356,12 +2125,15 @@ class DeckAnalyzer:
         # =====================================================================
         # COMBO ANALYSIS (from Commander Spellbook)
         # =====================================================================
+        # Unpack the combo dict once - each .get is a LOAD_METHOD + hash,
+        # and every field is needed on at least one branch below
         combo_count = combo_data.get("combo_count", 0)
         combo_bracket_impact = combo_data.get("bracket_impact", 0)
-        
-        if combo_data.get("has_cedh_combos"):
+        has_cedh_combos = combo_data.get("has_cedh_combos", False)
+        cedh_combo_count = combo_data.get("cedh_combo_count", 0)
+
+        if has_cedh_combos:
             bracket = max(bracket, 4)
-            cedh_combo_count = combo_data.get("cedh_combo_count", 0)
             reasons.append(f"🎯 Has {cedh_combo_count} cEDH-level combo(s) (Ruthless tier)")
         
         if combo_bracket_impact >= 4 and combo_count > 0:
@@ -1377,61 +2149,51 @@ class DeckAnalyzer:
             reasons.append(f"🎯 Verified combos: {combo_count} found")
         
         # =====================================================================
-        # GAME CHANGERS
+        # GAME CHANGERS (threshold ladder)
         # =====================================================================
-        if game_changers_count > 3:
-            bracket = max(bracket, 4)
-            reasons.append(f"📜 Has {game_changers_count} Game Changers (>3 requires Bracket 4+)")
-        elif game_changers_count > 0:
-            bracket = max(bracket, 3)
-            reasons.append(f"📜 Has {game_changers_count} Game Changer(s) (requires Bracket 3+)")
-        
+        rung = _ladder_rung(_GC_LADDER, game_changers_count)
+        if rung:
+            bracket = max(bracket, rung[1])
+            reasons.append(rung[2].format(n=game_changers_count))
+
         # =====================================================================
         # MASS LAND DENIAL
         # =====================================================================
         if has_mass_ld:
             bracket = max(bracket, 4)
             reasons.append("💥 Contains mass land denial (requires Bracket 4+)")
-        
+
         # =====================================================================
-        # EXTRA TURNS
+        # EXTRA TURNS (threshold ladder)
         # =====================================================================
-        if extra_turn_count >= 3:
-            bracket = max(bracket, 4)
-            reasons.append(f"⏰ Has {extra_turn_count} extra turn cards (high density)")
-        elif extra_turn_count >= 1:
-            bracket = max(bracket, 3)
-            reasons.append(f"⏰ Has {extra_turn_count} extra turn card(s)")
-        
+        rung = _ladder_rung(_EXTRA_TURN_LADDER, extra_turn_count)
+        if rung:
+            bracket = max(bracket, rung[1])
+            reasons.append(rung[2].format(n=extra_turn_count))
+
         # =====================================================================
-        # TUTOR SCORE (Weighted)
+        # TUTOR SCORE (weighted, threshold ladder)
         # =====================================================================
-        if tutor_score >= BRACKET_SCORING["tutor_bracket4_threshold"]:
-            bracket = max(bracket, 4)
-            reasons.append(f"🔍 High tutor density (score: {tutor_score:.1f})")
-        elif tutor_score >= BRACKET_SCORING["tutor_bracket3_threshold"]:
-            bracket = max(bracket, 3)
-            reasons.append(f"🔍 Moderate tutor density (score: {tutor_score:.1f})")
-        
+        rung = _ladder_rung(_TUTOR_LADDER, tutor_score)
+        if rung:
+            bracket = max(bracket, rung[1])
+            reasons.append(rung[2].format(n=tutor_score))
+
         # =====================================================================
-        # FAST MANA
+        # FAST MANA (threshold ladder)
         # =====================================================================
-        if fast_mana_count >= BRACKET_SCORING["fast_mana_bracket4_threshold"]:
-            bracket = max(bracket, 4)
-            reasons.append(f"💎 High fast mana count ({fast_mana_count} pieces)")
-        elif fast_mana_count >= 2:
-            bracket = max(bracket, 3)
-            reasons.append(f"💎 Has {fast_mana_count} fast mana pieces")
-        
+        rung = _ladder_rung(_FAST_MANA_LADDER, fast_mana_count)
+        if rung:
+            bracket = max(bracket, rung[1])
+            reasons.append(rung[2].format(n=fast_mana_count))
+
         # =====================================================================
-        # HIGH-POWER STAPLES
+        # HIGH-POWER STAPLES (threshold ladder)
         # =====================================================================
-        if staple_count >= BRACKET_SCORING["staples_bracket4_threshold"]:
-            bracket = max(bracket, 4)
-            reasons.append(f"⭐ High staple density ({staple_count} high-power cards)")
-        elif staple_count >= BRACKET_SCORING["staples_bracket3_threshold"]:
-            bracket = max(bracket, 3)
-            reasons.append(f"⭐ Has {staple_count} high-power staples")
+        rung = _ladder_rung(_STAPLE_LADDER, staple_count)
+        if rung:
+            bracket = max(bracket, rung[1])
+            reasons.append(rung[2].format(n=staple_count))
         
         # =====================================================================
         # COMBO ARCHETYPE (from detection)
@@ -1483,6 +2245,9 @@ class DeckAnalyzer:
 # Test the analyzer if run directly
 # ============================================================================
 if __name__ == "__main__":
+    # Show the analyzer's progress output when run standalone
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("Testing Deck Analyzer...")
     
     # Sample decklist for testing
@@ -26,6 +26,7 @@ Examples:
     python main.py
 """
 
+import logging
 import sys
 import os
 from typing import Optional, Tuple
@@ -44,6 +45,21 @@ from ai_analyzer import AIPlayAnalyzer
 from config import BRACKET_DEFINITIONS
 
 
+# One shared AI analyzer for the whole session, built on first use.
+# Constructing the Anthropic client sets up an HTTPS connection pool,
+# so rebuilding it on every menu action threw that pool away between
+# calls; reusing one instance keeps connections warm.
+_ai_analyzer: Optional[AIPlayAnalyzer] = None
+
+
+def _get_ai_analyzer() -> AIPlayAnalyzer:
+    """Return the shared AIPlayAnalyzer, creating it on first call."""
+    global _ai_analyzer
+    if _ai_analyzer is None:
+        _ai_analyzer = AIPlayAnalyzer()
+    return _ai_analyzer
+
+
 # =============================================================================
 # Display Functions
 # =============================================================================
@@ -183,13 +199,17 @@ def print_analysis_results(deck: DeckAnalysis):
     # Mana curve
     print_section_header("📈 MANA CURVE")
     max_count = max(deck.mana_curve.values()) if deck.mana_curve else 1
-    
-    for cmc in sorted(deck.mana_curve.keys()):
-        count = deck.mana_curve[cmc]
-        bar_length = int((count / max_count) * 20)
-        bar = "█" * bar_length
-        cmc_label = f"{cmc}+" if cmc == 7 else f"{cmc} "
-        print(f"    {cmc_label} │ {bar} ({count})")
+
+    # Build all the bar rows first and emit them in one write: a single
+    # syscall instead of a flushed print per row, and the bar scale is
+    # computed once instead of per line
+    scale = 20.0 / max_count
+    rows = [
+        f"    {f'{cmc}+' if cmc == 7 else f'{cmc} '} │ "
+        f"{'█' * int(deck.mana_curve[cmc] * scale)} ({deck.mana_curve[cmc]})"
+        for cmc in sorted(deck.mana_curve)
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
     
     # Card composition summary
     print_section_header("📦 CARD COMPOSITION")
@@ -389,7 +409,7 @@ def action_ai_analysis(deck: DeckAnalysis):
         return
     
     print_section_header("🤖 AI PLAY PATTERN ANALYSIS")
-    ai_analyzer = AIPlayAnalyzer()
+    ai_analyzer = _get_ai_analyzer()
     ai_insights = ai_analyzer.generate_play_pattern_analysis(deck)
     print(ai_insights)
 
@@ -405,7 +425,7 @@ def action_cut_suggestions(deck: DeckAnalysis):
         return
     
     print_section_header(f"✂️  CUT SUGGESTIONS ({cards_to_cut} cards to cut)")
-    ai_analyzer = AIPlayAnalyzer()
+    ai_analyzer = _get_ai_analyzer()
     cuts = ai_analyzer.generate_cut_suggestions(deck, target_size=target_size)
     print(cuts)
 
@@ -422,7 +442,7 @@ def action_bracket_advice(deck: DeckAnalysis):
     else:
         print_section_header(f"📋 ADVICE: MOVING TO BRACKET {target}")
     
-    ai_analyzer = AIPlayAnalyzer()
+    ai_analyzer = _get_ai_analyzer()
     advice = ai_analyzer.generate_bracket_adjustment_advice(deck, target)
     print(advice)
 
@@ -492,6 +512,11 @@ def main():
     """
     Main entry point for the bracket analyzer.
     """
+    # The analyzer modules emit progress through logging; the CLI wants
+    # all of it, message-only, so output looks the same as before.
+    # Embedders (batch scripts, servers) can configure WARNING instead.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print_banner()
     
     initial_deck = None
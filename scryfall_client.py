@@ -12,11 +12,227 @@ Key points about the Scryfall API:
 - Card data includes everything we need: text, types, colors, legality, etc.
 """
 
+import difflib
+import json
+import re
 import requests
+import sqlite3
+import sys
+import threading
 import time
-from typing import Optional, Dict, List, Any
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
 from config import SCRYFALL_API_BASE, SCRYFALL_RATE_LIMIT_MS
 
+# orjson parses JSON 3-5x faster than the stdlib, which matters for the
+# ~150 MB bulk file; it's optional, and stdlib json is a fine fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads_bytes(raw: bytes) -> Any:
+    """Parse JSON from bytes with orjson when available, stdlib otherwise."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class ScryfallBulkCache:
+    """
+    Local card lookup built from Scryfall's daily "oracle_cards" bulk file.
+
+    Scryfall publishes its whole card database as downloadable bulk files
+    and asks heavy users to prefer them over hammering the API. Downloading
+    the ~150 MB oracle_cards file once a day means every card lookup after
+    that is a plain dict hit - zero HTTP requests per deck.
+
+    The file is stored under ~/.cache/mtg_bracket/ and refreshed when
+    older than a day. Loading is lazy: nothing is read or downloaded
+    until the first lookup.
+    """
+
+    CACHE_DIR = Path.home() / ".cache" / "mtg_bracket"
+    CACHE_FILE = CACHE_DIR / "oracle_cards.json"
+    MAX_AGE_SECONDS = 24 * 60 * 60  # Scryfall regenerates bulk data daily
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+        # name (lowercase) -> card dict; None until first lookup
+        self._by_name: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up one card by (case-insensitive) name.
+
+        Returns None when the card isn't in the bulk file - the caller
+        should fall back to the network for those.
+
+        Hits are shallow copies: the analyzer tags cards with private
+        fields (_quantity, _name_lc, ...) in place, and handing out the
+        cache's own dicts would leak one deck's tags into the next.
+        """
+        self._ensure_loaded()
+        card = self._by_name.get(name.lower())
+        return dict(card) if card is not None else None
+
+    def fuzzy_lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Best local fuzzy match for a (probably misspelled) name.
+
+        Narrows the 30k-name index to entries sharing the query's first
+        two letters, then lets difflib pick the closest above a 0.8
+        similarity cutoff. Microseconds-to-milliseconds instead of an
+        HTTP round trip to the fuzzy endpoint; returns None when nothing
+        is close enough (the caller then falls back to the network,
+        which also handles typos in the first two letters).
+        """
+        self._ensure_loaded()
+        if not self._by_name:
+            return None
+
+        target = name.lower()
+        prefix = target[:2]
+        candidates = [k for k in self._by_name if k.startswith(prefix)]
+        match = difflib.get_close_matches(target, candidates, n=1, cutoff=0.8)
+        # Copied for the same reason as lookup(): callers mutate cards
+        return dict(self._by_name[match[0]]) if match else None
+
+    def _ensure_loaded(self):
+        """Load the bulk file into memory, downloading it first if stale."""
+        if self._by_name is not None:
+            return
+
+        self._by_name = {}
+
+        try:
+            if self._is_stale():
+                self._download()
+
+            with open(self.CACHE_FILE, "rb") as f:
+                cards = _loads_bytes(f.read())
+        except (OSError, ValueError, requests.RequestException) as e:
+            print(f"  ⚠️  Bulk card data unavailable ({e}), using API lookups")
+            return
+
+        # Index like get_cards_bulk does: oracle name plus MDFC front face
+        for card in cards:
+            oracle_name = card.get("name", "")
+            self._by_name[oracle_name.lower()] = card
+            if " // " in oracle_name:
+                front_face = oracle_name.split(" // ")[0]
+                self._by_name.setdefault(front_face.lower(), card)
+
+        print(f"  📦 Loaded {len(cards)} cards from Scryfall bulk data")
+
+    def _is_stale(self) -> bool:
+        try:
+            return time.time() - self.CACHE_FILE.stat().st_mtime > self.MAX_AGE_SECONDS
+        except OSError:
+            return True  # Missing file counts as stale
+
+    def _download(self):
+        """Fetch the current oracle_cards download URI and save the file."""
+        print("  📦 Downloading Scryfall bulk card data (once a day)...")
+
+        response = self._session.get(f"{SCRYFALL_API_BASE}/bulk-data", timeout=30)
+        response.raise_for_status()
+
+        download_uri = None
+        for entry in response.json().get("data", []):
+            if entry.get("type") == "oracle_cards":
+                download_uri = entry.get("download_uri")
+                break
+        if not download_uri:
+            raise ValueError("oracle_cards bulk entry not found")
+
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with self._session.get(download_uri, stream=True, timeout=300) as dl:
+            dl.raise_for_status()
+            # Stream to disk so we never hold file + parsed cards at once
+            with open(self.CACHE_FILE, "wb") as f:
+                for chunk in dl.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+
+
+class ScryfallDiskCache:
+    """
+    Persistent per-card response cache backed by SQLite.
+
+    Card data changes rarely, but every fresh session used to re-pay the
+    HTTP round trip (plus the politeness delay) for cards it had already
+    seen last week. This stores each card's JSON (zlib-compressed) keyed
+    by lowercase name with a 7-day TTL, so warm runs answer most lookups
+    from disk in microseconds.
+
+    Everything is best-effort: if the database can't be opened or a
+    statement fails, lookups just miss and the client falls back to the
+    network, same as having no cache at all.
+    """
+
+    DB_FILE = ScryfallBulkCache.CACHE_DIR / "scryfall.sqlite"
+    MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # Card data is stable week to week
+
+    def __init__(self):
+        # One shared connection guarded by a lock: lookups and stores
+        # happen from whatever thread merges results, and SQLite
+        # connections aren't thread-safe on their own
+        self._lock = threading.Lock()
+        self._conn = None
+        try:
+            self.DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.DB_FILE), check_same_thread=False)
+            # WAL lets a concurrent process read while we write;
+            # NORMAL sync is plenty for a cache we can always rebuild
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cards ("
+                "name TEXT PRIMARY KEY, fetched_at REAL, json BLOB)"
+            )
+            conn.commit()
+            self._conn = conn
+        except (sqlite3.Error, OSError):
+            pass  # No cache - every lookup goes to the network
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached card for a lowercase name, or None."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT json FROM cards WHERE name = ? AND fetched_at > ?",
+                    (name, time.time() - self.MAX_AGE_SECONDS)
+                ).fetchone()
+            if row is None:
+                return None
+            return _loads_bytes(zlib.decompress(row[0]))
+        except (sqlite3.Error, zlib.error, ValueError):
+            return None
+
+    def put_many(self, pairs: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store (lowercase name, card dict) pairs in one transaction."""
+        if self._conn is None or not pairs:
+            return
+        now = time.time()
+        try:
+            rows = [
+                (name, now, zlib.compress(json.dumps(card).encode("utf-8")))
+                for name, card in pairs
+            ]
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cards VALUES (?, ?, ?)", rows
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
 
 class ScryfallClient:
     """
@@ -28,18 +244,37 @@ class ScryfallClient:
     - Error handling for missing cards
     """
     
-    def __init__(self):
-        # Track when we last made a request (for rate limiting)
+    def __init__(self, use_bulk_data: bool = False):
+        # Track when we last made a request (for rate limiting).
+        # The lock makes the check-and-update atomic so parallel batch
+        # fetches still space their requests out correctly.
         self._last_request_time = 0
-        
+        self._rate_limit_lock = threading.Lock()
+
         # Session keeps connections alive for better performance
         self._session = requests.Session()
-        
+
         # Scryfall requires a User-Agent header identifying your app
         self._session.headers.update({
             "User-Agent": "MTGBracketAnalyzer/1.0",
             "Accept": "application/json"
         })
+
+        # Optional local bulk-data cache: serves card lookups from
+        # Scryfall's daily oracle_cards dump instead of the network.
+        # Opt-in because the first load downloads a large file.
+        self._bulk_cache = ScryfallBulkCache(self._session) if use_bulk_data else None
+
+        # Always-on per-card disk cache (best effort): cards fetched in
+        # earlier sessions are served from SQLite instead of re-fetched
+        self._disk_cache = ScryfallDiskCache()
+
+        # In-process memo over single-card lookups, per instance so
+        # separate clients don't share entries. Only successful lookups
+        # are stored: a None can mean a transient network error, and
+        # caching it would pin that name to "not found" for the whole
+        # session instead of retrying like every other cache here does.
+        self._card_memo: Dict[Tuple[str, bool], Dict[str, Any]] = {}
     
     def _rate_limit(self):
         """
@@ -47,18 +282,23 @@ class ScryfallClient:
         
         Scryfall allows ~10 requests per second. We track time between
         requests and sleep if we're going too fast.
+
+        Thread-safe: concurrent batch fetches take the lock, so request
+        *starts* stay spaced apart while the responses themselves can
+        overlap in flight.
         """
-        # Calculate time since last request (in milliseconds)
-        now = time.time() * 1000  # Convert to milliseconds
-        elapsed = now - self._last_request_time
-        
-        # If we haven't waited long enough, sleep for the remainder
-        if elapsed < SCRYFALL_RATE_LIMIT_MS:
-            sleep_time = (SCRYFALL_RATE_LIMIT_MS - elapsed) / 1000  # Convert back to seconds
-            time.sleep(sleep_time)
-        
-        # Update our last request time
-        self._last_request_time = time.time() * 1000
+        with self._rate_limit_lock:
+            # Calculate time since last request (in milliseconds)
+            now = time.time() * 1000  # Convert to milliseconds
+            elapsed = now - self._last_request_time
+
+            # If we haven't waited long enough, sleep for the remainder
+            if elapsed < SCRYFALL_RATE_LIMIT_MS:
+                sleep_time = (SCRYFALL_RATE_LIMIT_MS - elapsed) / 1000  # Convert back to seconds
+                time.sleep(sleep_time)
+
+            # Update our last request time
+            self._last_request_time = time.time() * 1000
     
     def get_card_by_name(self, name: str, fuzzy: bool = True) -> Optional[Dict[str, Any]]:
         """
@@ -80,6 +320,49 @@ class ScryfallClient:
             - keywords: []
             - legalities: {"commander": "legal", ...}
         """
+        # Normalize the key so "Forest" / "forest " dedupe in the memo
+        # (Scryfall's named endpoint is case-insensitive anyway)
+        key = (name.strip().lower(), fuzzy)
+        card = self._card_memo.get(key)
+        if card is None:
+            card = self._get_card_uncached(*key)
+            if card is not None:
+                # Cap like the other memos: wipe and refill rather than
+                # track recency - 4096 names outlasts any one session
+                if len(self._card_memo) >= 4096:
+                    self._card_memo.clear()
+                self._card_memo[key] = card
+        # Hand back a shallow copy so callers tagging the card in place
+        # (the analyzer's _quantity/_name_lc fields) can't corrupt the
+        # memo's pristine entry for later callers
+        return dict(card) if card is not None else None
+
+    def _get_card_uncached(self, name: str, fuzzy: bool) -> Optional[Dict[str, Any]]:
+        """
+        The uncached lookup behind get_card_by_name's per-instance memo.
+
+        Checks the bulk snapshot, then the disk cache, then HTTP.
+        """
+        # Serve from the local bulk snapshot when enabled - exact-name
+        # hits never touch the network (typos still fall through to the
+        # fuzzy endpoint below)
+        if self._bulk_cache is not None:
+            card = self._bulk_cache.lookup(name)
+            if card is not None:
+                return card
+
+        # Then the persistent per-card cache from earlier sessions
+        cached = self._disk_cache.get(name)
+        if cached is not None:
+            return cached
+
+        # With the snapshot loaded, typos can usually be resolved
+        # locally too, skipping the fuzzy endpoint's round trip
+        if fuzzy and self._bulk_cache is not None:
+            card = self._bulk_cache.fuzzy_lookup(name)
+            if card is not None:
+                return card
+
         # Respect rate limits before making the request
         self._rate_limit()
         
@@ -92,10 +375,15 @@ class ScryfallClient:
         
         try:
             response = self._session.get(endpoint, params=params)
-            
+
             # Check if the card was found
             if response.status_code == 200:
-                return response.json()
+                card = response.json()
+                # Remember it under both the asked-for and oracle names
+                # so next session's lookup hits either way
+                keys = {name, card.get("name", "").lower()}
+                self._disk_cache.put_many([(k, card) for k in keys if k])
+                return card
             elif response.status_code == 404:
                 # Card not found - this is normal for typos or wrong names
                 print(f"  ⚠️  Card not found: '{name}'")
@@ -109,126 +397,238 @@ class ScryfallClient:
             print(f"  ❌ Network error fetching '{name}': {e}")
             return None
     
-    def get_cards_bulk(self, names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    def iter_cards_bulk(self, names: List[str], batch_size: int = 75):
         """
-        Fetch multiple cards by name.
-        
-        This is more efficient than calling get_card_by_name repeatedly
-        because it can use Scryfall's collection endpoint for batches.
-        
+        Stream cards from Scryfall's collection endpoint batch by batch.
+
+        Yields (lookup_key, card) pairs as each batch of 75 names returns,
+        so callers can start processing while later batches are still in
+        flight, and peak memory stays at one batch instead of the whole
+        result set.
+
         Handles MDFCs (Modal Double-Faced Cards) by:
         1. Trying the full name first (e.g., "Malakir Rebirth // Malakir Mire")
         2. Retrying with just the front face if full name fails
-        3. Storing results under BOTH the search name AND the oracle name
-        
+        3. Yielding under BOTH the oracle name AND the front face name
+
         Args:
             names: List of card names to fetch
-        
-        Returns:
-            A dictionary mapping card names to their data (or None if not found)
+            batch_size: Names per collection request (Scryfall max is 75)
+
+        Yields:
+            (lowercase lookup key, card dict or None if not found) tuples
         """
-        results = {}
         not_found_names = []  # Track cards that weren't found for retry
-        
-        # Map from search name to original name (for later lookup)
-        # This helps us store the result under the name the user provided
-        search_to_original = {name.lower(): name for name in names}
-        
-        batch_size = 75
-        
+
         for i in range(0, len(names), batch_size):
-            batch = names[i:i + batch_size]
-            identifiers = [{"name": name} for name in batch]
-            
-            self._rate_limit()
-            
-            try:
-                response = self._session.post(
-                    f"{SCRYFALL_API_BASE}/cards/collection",
-                    json={"identifiers": identifiers}
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    # Process found cards
-                    for card in data.get("data", []):
-                        oracle_name = card.get("name", "")
-                        
-                        # Store under the oracle name (what Scryfall returns)
-                        results[oracle_name.lower()] = card
-                        
-                        # For MDFCs, ALSO store under the front face name
-                        # This handles cases where decklist has just "Malakir Rebirth"
-                        # but Scryfall returns "Malakir Rebirth // Malakir Mire"
-                        if " // " in oracle_name:
-                            front_face = oracle_name.split(" // ")[0]
-                            results[front_face.lower()] = card
-                    
-                    # Track cards that weren't found (might be MDFCs needing retry)
-                    for not_found in data.get("not_found", []):
-                        name = not_found.get("name", "Unknown")
-                        not_found_names.append(name)
-                else:
-                    print(f"  ❌ Batch request failed: HTTP {response.status_code}")
-                    
-            except requests.RequestException as e:
-                print(f"  ❌ Network error in batch request: {e}")
-        
+            cards, missing = self._fetch_collection_batch(names[i:i + batch_size])
+
+            # Yield found cards as they arrive
+            for card in cards:
+                oracle_name = card.get("name", "")
+
+                # Yield under the oracle name (what Scryfall returns)
+                yield oracle_name.lower(), card
+
+                # For MDFCs, ALSO yield under the front face name
+                # This handles cases where decklist has just "Malakir Rebirth"
+                # but Scryfall returns "Malakir Rebirth // Malakir Mire"
+                if " // " in oracle_name:
+                    front_face = oracle_name.split(" // ")[0]
+                    yield front_face.lower(), card
+
+            # Cards that weren't found might be MDFCs needing retry
+            not_found_names.extend(missing)
+
         # Retry not-found cards using front face name (for MDFCs)
         # This handles "Malakir Rebirth // Malakir Mire" -> try "Malakir Rebirth"
-        if not_found_names:
-            mdfc_retries = []
-            for name in not_found_names:
-                if " // " in name:
-                    # It's an MDFC written as "Front // Back" - try just front
-                    front_face = name.split(" // ")[0]
-                    mdfc_retries.append((name, front_face))
-                else:
-                    # Not an MDFC format, genuinely not found
-                    print(f"  ⚠️  Card not found: '{name}'")
-                    results[name.lower()] = None
-            
-            # Retry MDFCs with front face names
-            if mdfc_retries:
-                front_face_names = [front for _, front in mdfc_retries]
-                
-                for i in range(0, len(front_face_names), batch_size):
-                    batch = front_face_names[i:i + batch_size]
-                    identifiers = [{"name": name} for name in batch]
-                    
-                    self._rate_limit()
-                    
-                    try:
-                        response = self._session.post(
-                            f"{SCRYFALL_API_BASE}/cards/collection",
-                            json={"identifiers": identifiers}
-                        )
-                        
-                        if response.status_code == 200:
-                            data = response.json()
-                            
-                            for card in data.get("data", []):
-                                oracle_name = card.get("name", "")
-                                # Store under oracle name
-                                results[oracle_name.lower()] = card
-                                # Also store under front face for lookups
-                                if " // " in oracle_name:
-                                    front_face = oracle_name.split(" // ")[0]
-                                    results[front_face.lower()] = card
-                            
-                            # Any still not found are truly missing
-                            for not_found in data.get("not_found", []):
-                                name = not_found.get("name", "Unknown")
-                                # Find the original full name
-                                for orig_name, front in mdfc_retries:
-                                    if front == name:
-                                        print(f"  ⚠️  Card not found: '{orig_name}'")
-                                        results[orig_name.lower()] = None
-                                        break
-                    except requests.RequestException as e:
-                        print(f"  ❌ Network error in MDFC retry: {e}")
-        
+        yield from self._resolve_not_found(not_found_names, batch_size)
+
+    def _fetch_collection_batch(
+        self, batch: List[str]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        POST one batch of names to the collection endpoint.
+
+        Returns (found card dicts, not-found names). Network or HTTP
+        failures are reported and produce an empty result, matching the
+        old inline behavior. Thread-safe, so batches can run in parallel.
+        """
+        identifiers = [{"name": name} for name in batch]
+
+        self._rate_limit()
+
+        try:
+            response = self._session.post(
+                f"{SCRYFALL_API_BASE}/cards/collection",
+                json={"identifiers": identifiers}
+            )
+
+            if response.status_code == 200:
+                data = _loads_bytes(response.content)
+                not_found = [
+                    nf.get("name", "Unknown") for nf in data.get("not_found", [])
+                ]
+                cards = data.get("data", [])
+                # Intern names at the single point they come off the wire:
+                # every later dict-key/set-membership comparison on a card
+                # name becomes a pointer compare instead of a char compare
+                for card in cards:
+                    if "name" in card:
+                        card["name"] = sys.intern(card["name"])
+                return cards, not_found
+
+            print(f"  ❌ Batch request failed: HTTP {response.status_code}")
+
+        except requests.RequestException as e:
+            print(f"  ❌ Network error in batch request: {e}")
+
+        return [], []
+
+    def _resolve_not_found(
+        self, not_found_names: List[str], batch_size: int = 75
+    ) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Front-face retry for not-found names written as "Front // Back".
+
+        Returns (lookup key, card or None) pairs: retried MDFC hits under
+        both their names, and genuinely missing cards as None (with a
+        warning printed).
+        """
+        pairs = []
+        mdfc_retries = []
+
+        for name in not_found_names:
+            if " // " in name:
+                # It's an MDFC written as "Front // Back" - try just front
+                mdfc_retries.append((name, name.split(" // ")[0]))
+            else:
+                # Not an MDFC format, genuinely not found
+                print(f"  ⚠️  Card not found: '{name}'")
+                pairs.append((name.lower(), None))
+
+        if mdfc_retries:
+            front_face_names = [front for _, front in mdfc_retries]
+
+            for i in range(0, len(front_face_names), batch_size):
+                cards, missing = self._fetch_collection_batch(
+                    front_face_names[i:i + batch_size]
+                )
+
+                for card in cards:
+                    oracle_name = card.get("name", "")
+                    # Record under oracle name
+                    pairs.append((oracle_name.lower(), card))
+                    # Also record under front face for lookups
+                    if " // " in oracle_name:
+                        front_face = oracle_name.split(" // ")[0]
+                        pairs.append((front_face.lower(), card))
+
+                # Any still not found are truly missing
+                for name in missing:
+                    # Find the original full name
+                    for orig_name, front in mdfc_retries:
+                        if front == name:
+                            print(f"  ⚠️  Card not found: '{orig_name}'")
+                            pairs.append((orig_name.lower(), None))
+                            break
+
+        return pairs
+
+    def get_cards_bulk(self, names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch multiple cards by name.
+
+        This is more efficient than calling get_card_by_name repeatedly
+        because it can use Scryfall's collection endpoint for batches.
+        Thin wrapper over iter_cards_bulk() that materializes the full
+        lookup dictionary; callers that can process incrementally should
+        use the iterator directly.
+
+        Args:
+            names: List of card names to fetch
+
+        Returns:
+            A dictionary mapping card names to their data (or None if not found)
+        """
+        results = {}
+        remaining = names
+
+        # Serve what we can from the local bulk-data cache first; only
+        # names it doesn't know still go over the network
+        if self._bulk_cache is not None:
+            remaining = []
+            for name in names:
+                card = self._bulk_cache.lookup(name)
+                if card is None:
+                    remaining.append(name)
+                    continue
+                oracle_name = card.get("name", "")
+                results[oracle_name.lower()] = card
+                results[name.lower()] = card
+                if " // " in oracle_name:
+                    front_face = oracle_name.split(" // ")[0]
+                    results[front_face.lower()] = card
+
+        if remaining:
+            # Next, the per-card disk cache from earlier sessions: serve
+            # hits locally and send only the misses over the network
+            misses = []
+            for name in remaining:
+                card = self._disk_cache.get(name.strip().lower())
+                if card is None:
+                    misses.append(name)
+                    continue
+                oracle_name = card.get("name", "")
+                results[oracle_name.lower()] = card
+                results[name.lower()] = card
+                if " // " in oracle_name:
+                    front_face = oracle_name.split(" // ")[0]
+                    results[front_face.lower()] = card
+            remaining = misses
+
+        if remaining:
+            batch_size = 75  # Scryfall's collection endpoint maximum
+            if len(remaining) > batch_size:
+                # Multiple batches: POST them in parallel. The rate
+                # limiter is thread-safe, so request starts stay politely
+                # spaced while the round trips overlap - wall time is
+                # roughly one RTT plus the spacing instead of their sum.
+                batches = [
+                    remaining[i:i + batch_size]
+                    for i in range(0, len(remaining), batch_size)
+                ]
+                not_found = []
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    for cards, missing in pool.map(
+                        self._fetch_collection_batch, batches
+                    ):
+                        for card in cards:
+                            oracle_name = card.get("name", "")
+                            results[oracle_name.lower()] = card
+                            if " // " in oracle_name:
+                                front_face = oracle_name.split(" // ")[0]
+                                results[front_face.lower()] = card
+                        not_found.extend(missing)
+                results.update(self._resolve_not_found(not_found, batch_size))
+            else:
+                results.update(self.iter_cards_bulk(remaining))
+
+            # Persist what the network just gave us so the next session
+            # skips these names entirely (stored under both the requested
+            # and oracle names; not-found names are never cached)
+            store = []
+            for name in remaining:
+                key = name.strip().lower()
+                card = results.get(key)
+                if card is None:
+                    continue
+                store.append((key, card))
+                oracle_lc = card.get("name", "").lower()
+                if oracle_lc and oracle_lc != key:
+                    store.append((oracle_lc, card))
+            self._disk_cache.put_many(store)
+
         return results
     
     def search_cards(self, query: str, unique: str = "cards") -> List[Dict[str, Any]]:
@@ -327,6 +727,15 @@ class ScryfallClient:
         ]
 
 
+# Lines to ignore: blank, comments ("#", "//"), and section headers
+# like "// Commander" or "SIDEBOARD:"
+_DECKLIST_SKIP_RE = re.compile(r"^\s*(?:$|#|//|commander|sideboard)", re.IGNORECASE)
+
+# "4 Lightning Bolt" / "1x Sol Ring" - a leading count (optional 'x'
+# suffix) followed by the card name, ignoring surrounding whitespace
+_DECKLIST_QTY_RE = re.compile(r"^\s*(\d+)[xX]?\s+(\S[^\n]*?)\s*$")
+
+
 def parse_decklist(decklist_text: str) -> List[Dict[str, Any]]:
     """
     Parse a decklist from common formats into a structured list.
@@ -344,40 +753,22 @@ def parse_decklist(decklist_text: str) -> List[Dict[str, Any]]:
         List of dicts with 'quantity' and 'name' keys
     """
     cards = []
-    
+
+    # Two precompiled patterns replace the old per-line strip /
+    # startswith chain / split / rstrip / try-int dance: each line costs
+    # at most two C-level regex matches, which matters for 10k-line
+    # paste jobs (cube lists, collection exports)
     for line in decklist_text.strip().split("\n"):
-        line = line.strip()
-        
-        # Skip empty lines and comments
-        if not line or line.startswith("#") or line.startswith("//"):
-            continue
-        
-        # Skip section headers like "// Commander" or "SIDEBOARD:"
-        if line.upper().startswith("COMMANDER") or line.upper().startswith("SIDEBOARD"):
-            continue
-        if line.startswith("//"):
+        if _DECKLIST_SKIP_RE.match(line):
             continue
-            
-        # Try to parse "quantity name" format
-        # Examples: "1 Sol Ring", "1x Sol Ring", "4 Lightning Bolt"
-        parts = line.split(None, 1)  # Split on first whitespace
-        
-        if len(parts) == 2:
-            quantity_str, name = parts
-            
-            # Handle "1x" format
-            quantity_str = quantity_str.rstrip("x").rstrip("X")
-            
-            try:
-                quantity = int(quantity_str)
-                cards.append({"quantity": quantity, "name": name.strip()})
-            except ValueError:
-                # If first part isn't a number, treat whole line as card name
-                cards.append({"quantity": 1, "name": line})
+
+        match = _DECKLIST_QTY_RE.match(line)
+        if match:
+            cards.append({"quantity": int(match.group(1)), "name": match.group(2)})
         else:
-            # Single word on line - probably just a card name
-            cards.append({"quantity": 1, "name": line})
-    
+            # No leading count - the whole line is the card name
+            cards.append({"quantity": 1, "name": line.strip()})
+
     return cards
 
 
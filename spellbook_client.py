@@ -14,11 +14,16 @@ Key endpoints:
 - variants: Search for specific combos by card names
 """
 
+import logging
 import requests
 import time
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 
+# API/parse warnings go through logging so embedders can silence them
+# (the CLI configures INFO-and-up, so nothing changes interactively)
+log = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Configuration
@@ -190,10 +195,10 @@ class SpellbookClient:
             return self._parse_response(data)
             
         except requests.exceptions.RequestException as e:
-            print(f"  ⚠️  Commander Spellbook API error: {e}")
+            log.warning(f"  ⚠️  Commander Spellbook API error: {e}")
             return None
         except (KeyError, ValueError) as e:
-            print(f"  ⚠️  Error parsing Spellbook response: {e}")
+            log.warning(f"  ⚠️  Error parsing Spellbook response: {e}")
             return None
     
     def _parse_response(self, data: Dict[str, Any]) -> DeckCombos:
@@ -288,7 +293,7 @@ class SpellbookClient:
             )
             
         except Exception as e:
-            print(f"  ⚠️  Error parsing combo: {e}")
+            log.warning(f"  ⚠️  Error parsing combo: {e}")
             return None
 
 